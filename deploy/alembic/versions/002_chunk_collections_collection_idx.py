@@ -0,0 +1,40 @@
+"""chunk_collections_collection_idx
+
+Revision ID: 002_chunk_collections_collection_idx
+Revises: 001_baseline
+Create Date: 2026-10-17
+
+Add a (collection_id, chunk_id) index on chunk_collections. The primary key
+leads with chunk_id, so every collection-scoped query (search with a
+collection filter, collection stats, delete_collection) had to scan the
+whole junction table to find a collection's chunks.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002_chunk_collections_collection_idx'
+down_revision: Union[str, Sequence[str], None] = '001_baseline'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - add collection-first index on chunk_collections."""
+    op.create_index(
+        'chunk_collections_collection_idx',
+        'chunk_collections',
+        ['collection_id', 'chunk_id'],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - drop the collection-first index."""
+    op.drop_index(
+        'chunk_collections_collection_idx',
+        table_name='chunk_collections',
+        if_exists=True,
+    )
@@ -63,6 +63,9 @@ CREATE INDEX document_chunks_source_idx ON document_chunks(source_document_id);
 -- Index for chunk metadata queries
 CREATE INDEX document_chunks_metadata_idx ON document_chunks USING gin (metadata);
 
+-- Index for collection-scoped chunk lookups (primary key leads with chunk_id)
+CREATE INDEX chunk_collections_collection_idx ON chunk_collections(collection_id, chunk_id);
+
 -- Trigger for source_documents updated_at
 CREATE TRIGGER update_source_documents_updated_at
     BEFORE UPDATE ON source_documents
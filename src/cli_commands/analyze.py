@@ -1,6 +1,5 @@
 """Analysis commands."""
 
-import asyncio
 import sys
 from urllib.parse import urlparse
 
@@ -8,6 +7,7 @@ import click
 from rich.console import Console
 from rich.table import Table
 
+from src.core.event_loop import run_async
 from src.ingestion.website_analyzer import analyze_website_async
 
 console = Console()
@@ -51,7 +51,7 @@ def analyze_website_cmd(url, include_urls, max_urls, timeout):
         console.print(f"[bold blue]Analyzing website: {url}[/bold blue]\n")
 
         # Perform analysis (run async function in sync context)
-        result = asyncio.run(analyze_website_async(
+        result = run_async(analyze_website_async(
             base_url=url,
             include_url_lists=include_urls,
             max_urls_per_pattern=max_urls
@@ -71,8 +71,7 @@ def analyze_website_cmd(url, include_urls, max_urls, timeout):
         # Show domains if multiple
         if "domains" in result and len(result["domains"]) > 1:
             console.print(f"[yellow]⚠ Sitemap contains URLs from {len(result['domains'])} domains:[/yellow]")
-            for domain in result["domains"]:
-                console.print(f"  • {domain}")
+            console.print("\n".join(f"  • {domain}" for domain in result["domains"]))
         elif "domains" in result and len(result["domains"]) == 1:
             console.print(f"[dim]Domain: {result['domains'][0]}[/dim]")
 
@@ -88,10 +87,11 @@ def analyze_website_cmd(url, include_urls, max_urls, timeout):
 
             for pattern, stats in result["pattern_stats"].items():
                 # Format example URLs (show just paths, truncate if needed)
-                examples = stats["example_urls"][:3]
+                # Parse each URL once and truncate the resulting path
+                paths = [urlparse(url).path for url in stats["example_urls"][:3]]
                 example_text = "\n".join([
-                    urlparse(url).path[:50] + ("..." if len(urlparse(url).path) > 50 else "")
-                    for url in examples
+                    path[:50] + ("..." if len(path) > 50 else "")
+                    for path in paths
                 ])
 
                 table.add_row(
@@ -106,11 +106,11 @@ def analyze_website_cmd(url, include_urls, max_urls, timeout):
         # Show full URL lists if requested
         if include_urls and "url_groups" in result:
             console.print(f"\n[bold cyan]URL Lists (max {max_urls} per pattern):[/bold cyan]\n")
+            # One console write per pattern group rather than one per URL
             for pattern, urls in result["url_groups"].items():
-                console.print(f"[bold]{pattern}[/bold] ({len(urls)} URLs):")
-                for url in urls:
-                    console.print(f"  • {url}")
-                console.print()
+                lines = [f"[bold]{pattern}[/bold] ({len(urls)} URLs):"]
+                lines.extend(f"  • {url}" for url in urls)
+                console.print("\n".join(lines) + "\n")
 
         console.print(f"\n[dim]{result['notes']}[/dim]")
 
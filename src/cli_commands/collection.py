@@ -315,7 +315,7 @@ def collection_delete(name, yes):
     and Neo4j graph data (episodes, entities, relationships) associated with
     the collection.
     """
-    import asyncio
+    from src.core.event_loop import run_async
 
     async def _delete_with_graph():
         """Helper to run deletion with graph cleanup."""
@@ -366,4 +366,4 @@ def collection_delete(name, yes):
             sys.exit(1)
 
     # Run async function
-    asyncio.run(_delete_with_graph())
+    run_async(_delete_with_graph())
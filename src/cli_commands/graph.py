@@ -1,6 +1,5 @@
 """Knowledge graph query commands."""
 
-import asyncio
 import logging
 import os
 import sys
@@ -9,6 +8,7 @@ import time
 import click
 from rich.console import Console
 
+from src.core.event_loop import run_async
 from src.unified import GraphStore
 
 console = Console()
@@ -62,7 +62,7 @@ def graph_query_relationships(query, limit, threshold, collection, verbose):
         console.print(f"Threshold: {threshold}\n")
 
         # Call business logic layer (same as MCP tool)
-        result = asyncio.run(query_relationships_impl(
+        result = run_async(query_relationships_impl(
             graph_store,
             query,
             collection_name=collection,
@@ -81,20 +81,22 @@ def graph_query_relationships(query, limit, threshold, collection, verbose):
         console.print(f"[bold green]Found {result['num_results']} relationship(s):[/bold green]\n")
 
         for i, rel in enumerate(result["relationships"], 1):
-            console.print(f"[bold cyan]{i}. {rel['relationship_type']}[/bold cyan]")
-            console.print(f"   {rel['fact']}")
+            lines = [
+                f"[bold cyan]{i}. {rel['relationship_type']}[/bold cyan]",
+                f"   {rel['fact']}",
+            ]
 
             if verbose:
                 if rel.get("id"):
-                    console.print(f"   [dim]ID: {rel['id']}[/dim]")
+                    lines.append(f"   [dim]ID: {rel['id']}[/dim]")
                 if rel.get("source_node_id"):
-                    console.print(f"   [dim]Source node: {rel['source_node_id']}[/dim]")
+                    lines.append(f"   [dim]Source node: {rel['source_node_id']}[/dim]")
                 if rel.get("target_node_id"):
-                    console.print(f"   [dim]Target node: {rel['target_node_id']}[/dim]")
+                    lines.append(f"   [dim]Target node: {rel['target_node_id']}[/dim]")
                 if rel.get("valid_from"):
-                    console.print(f"   [dim]Established: {rel['valid_from']}[/dim]")
+                    lines.append(f"   [dim]Established: {rel['valid_from']}[/dim]")
 
-            console.print()
+            console.print("\n".join(lines) + "\n")
 
     except ImportError:
         console.print("[bold red]Error: Graphiti not installed. Knowledge Graph features unavailable.[/bold red]")
@@ -152,7 +154,7 @@ def graph_query_temporal(query, limit, threshold, collection, valid_from, valid_
             console.print(f"[cyan]Temporal filters: from={valid_from}, until={valid_until}[/cyan]\n")
 
         # Call business logic layer (same as MCP tool)
-        result = asyncio.run(query_temporal_impl(
+        result = run_async(query_temporal_impl(
             graph_store,
             query,
             collection_name=collection,
@@ -174,13 +176,15 @@ def graph_query_temporal(query, limit, threshold, collection, valid_from, valid_
 
         for i, item in enumerate(result["timeline"], 1):
             status_icon = "✅" if item["status"] == "current" else "⏰"
-            console.print(f"[bold cyan]{status_icon} {i}. {item['relationship_type']}[/bold cyan]")
-            console.print(f"   {item['fact']}")
-            console.print(f"   Valid from: {item.get('valid_from', 'N/A')}")
+            lines = [
+                f"[bold cyan]{status_icon} {i}. {item['relationship_type']}[/bold cyan]",
+                f"   {item['fact']}",
+                f"   Valid from: {item.get('valid_from', 'N/A')}",
+            ]
             if item.get("valid_until"):
-                console.print(f"   Valid until: {item['valid_until']}")
-            console.print(f"   Status: {item['status']}")
-            console.print()
+                lines.append(f"   Valid until: {item['valid_until']}")
+            lines.append(f"   Status: {item['status']}")
+            console.print("\n".join(lines) + "\n")
 
     except ImportError:
         console.print("[bold red]Error: Graphiti not installed. Knowledge Graph features unavailable.[/bold red]")
@@ -276,13 +280,13 @@ def graph_rebuild_communities(collection, yes):
             console.print("[dim]This may take several minutes depending on graph size...[/dim]\n")
 
             # Start timer
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             # Call Graphiti's build_communities method
             communities, community_edges = await graphiti.build_communities(group_ids=group_ids)
 
             # Calculate duration
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             minutes = int(duration // 60)
             seconds = int(duration % 60)
 
@@ -318,4 +322,4 @@ def graph_rebuild_communities(collection, yes):
             sys.exit(1)
 
     # Run the async function
-    asyncio.run(run_rebuild())
+    run_async(run_rebuild())
@@ -1,6 +1,5 @@
 """Ingestion commands."""
 
-import asyncio
 import json
 import logging
 import sys
@@ -13,6 +12,7 @@ from src.core.chunking import ChunkingConfig, get_document_chunker
 from src.core.collections import get_collection_manager
 from src.core.database import get_database
 from src.core.embeddings import get_embedding_generator
+from src.core.event_loop import run_async
 from src.ingestion.document_store import get_document_store
 from src.ingestion.web_crawler import WebCrawler, crawl_single_page
 
@@ -168,7 +168,7 @@ def ingest_text_cmd(content, collection, title, metadata):
             traceback.print_exc()
             sys.exit(1)
 
-    asyncio.run(run_ingest())
+    run_async(run_ingest())
 
 
 @ingest.command("file")
@@ -251,7 +251,7 @@ def ingest_file_cmd(path, collection, metadata):
             traceback.print_exc()
             sys.exit(1)
 
-    asyncio.run(run_ingest())
+    run_async(run_ingest())
 
 
 @ingest.command("directory")
@@ -285,22 +285,24 @@ def ingest_directory(path, collection, extensions, recursive, metadata):
             if metadata_dict:
                 console.print(f"[dim]Applying metadata: {metadata}[/dim]")
 
-            # Find all matching files
-            files = []
-            if recursive:
-                for ext in ext_list:
-                    files.extend(path_obj.rglob(f"*{ext}"))
-            else:
-                for ext in ext_list:
-                    files.extend(path_obj.glob(f"*{ext}"))
-
-            files = sorted(set(files))  # Remove duplicates and sort
+            # Find all matching files (one directory walk for all extensions)
+            suffixes = tuple(ext_list)
+            candidates = path_obj.rglob("*") if recursive else path_obj.iterdir()
+            files = sorted(f for f in candidates if f.name.endswith(suffixes))
 
             # Initialize Knowledge Graph components (lazy initialization within async context)
             local_graph_store, local_unified_mediator = (
                 await initialize_graph_components()
             )
 
+            # RAG-only fallback: build the document store once, not per file
+            doc_store = None
+            if not local_unified_mediator:
+                db = get_database()
+                embedder = get_embedding_generator()
+                coll_mgr = get_collection_manager(db)
+                doc_store = get_document_store(db, embedder, coll_mgr)
+
             # Ingest each file
             source_ids = []
             total_chunks = 0
@@ -342,11 +344,6 @@ def ingest_directory(path, collection, extensions, recursive, metadata):
 
                     # Fallback: RAG-only mode
                     else:
-                        db = get_database()
-                        embedder = get_embedding_generator()
-                        coll_mgr = get_collection_manager(db)
-                        doc_store = get_document_store(db, embedder, coll_mgr)
-
                         source_id, chunk_ids = doc_store.ingest_file(
                             str(file_path), collection
                         )
@@ -374,7 +371,7 @@ def ingest_directory(path, collection, extensions, recursive, metadata):
             traceback.print_exc()
             sys.exit(1)
 
-    asyncio.run(run_ingest())
+    run_async(run_ingest())
 
 
 @ingest.command("url")
@@ -487,21 +484,22 @@ def ingest_url(
                     )
 
                     # Step 2: Delete the old documents and their chunks
-                    embedder = get_embedding_generator()
-                    coll_mgr = get_collection_manager(db)
-                    web_chunking_config = ChunkingConfig(
-                        chunk_size=chunk_size, chunk_overlap=chunk_overlap
-                    )
-                    web_chunker = get_document_chunker(web_chunking_config)
-                    web_doc_store = get_document_store(
-                        db, embedder, coll_mgr, chunker=web_chunker
-                    )
+                    # Count chunks for all documents in one query before deleting
+                    with conn.cursor() as cur:
+                        cur.execute(
+                            """
+                            SELECT source_document_id, COUNT(*)
+                            FROM document_chunks
+                            WHERE source_document_id = ANY(%s)
+                            GROUP BY source_document_id
+                            """,
+                            ([doc_id for doc_id, _, _ in existing_docs],),
+                        )
+                        chunk_counts = dict(cur.fetchall())
 
                     for doc_id, filename, doc_metadata in existing_docs:
                         try:
-                            # Get chunk count before deletion
-                            chunks = web_doc_store.get_document_chunks(doc_id)
-                            chunk_count = len(chunks)
+                            chunk_count = chunk_counts.get(doc_id, 0)
 
                             # Delete the document (cascades to chunks and chunk_collections)
                             with conn.cursor() as cur:
@@ -552,6 +550,20 @@ def ingest_url(
 
                 console.print(f"[green]✓ Crawled {len(results)} pages[/green]")
 
+                # RAG-only fallback: build the web document store once, not per page
+                web_doc_store = None
+                if not local_unified_mediator:
+                    db = get_database()
+                    embedder = get_embedding_generator()
+                    coll_mgr = get_collection_manager(db)
+                    web_chunking_config = ChunkingConfig(
+                        chunk_size=chunk_size, chunk_overlap=chunk_overlap
+                    )
+                    web_chunker = get_document_chunker(web_chunking_config)
+                    web_doc_store = get_document_store(
+                        db, embedder, coll_mgr, chunker=web_chunker
+                    )
+
                 # Ingest each page
                 total_chunks = 0
                 total_entities = 0
@@ -564,6 +576,17 @@ def ingest_url(
                         )
                         continue
 
+                    # Nothing survived content filtering - skip before paying for
+                    # chunking, embeddings and entity extraction on an empty document
+                    if not result.content or result.content.isspace():
+                        console.print(
+                            f"  [yellow]⚠ Skipped empty page {i}: {result.url}[/yellow]"
+                        )
+                        continue
+
+                    page_title = result.metadata.get("title", result.url)
+                    page_label = f"Page {i}/{len(results)}: {page_title[:50]}..."
+
                     try:
                         # Merge user metadata with page metadata
                         page_metadata = metadata_dict.copy() if metadata_dict else {}
@@ -574,34 +597,23 @@ def ingest_url(
                             ingest_result = await local_unified_mediator.ingest_text(
                                 content=result.content,
                                 collection_name=collection,
-                                document_title=result.metadata.get("title", result.url),
+                                document_title=page_title,
                                 metadata=page_metadata,
                             )
                             total_chunks += ingest_result["num_chunks"]
                             total_entities += ingest_result.get("entities_extracted", 0)
                             successful_ingests += 1
                             console.print(
-                                f"  ✓ Page {i}/{len(results)}: {result.metadata.get('title', result.url)[:50]}... "
+                                f"  ✓ {page_label} "
                                 f"({ingest_result['num_chunks']} chunks, {ingest_result.get('entities_extracted', 0)} entities, "
                                 f"depth={result.metadata.get('crawl_depth', 0)})"
                             )
 
                         # Fallback: RAG-only mode
                         else:
-                            db = get_database()
-                            embedder = get_embedding_generator()
-                            coll_mgr = get_collection_manager(db)
-                            web_chunking_config = ChunkingConfig(
-                                chunk_size=chunk_size, chunk_overlap=chunk_overlap
-                            )
-                            web_chunker = get_document_chunker(web_chunking_config)
-                            web_doc_store = get_document_store(
-                                db, embedder, coll_mgr, chunker=web_chunker
-                            )
-
                             source_id, chunk_ids = web_doc_store.ingest_document(
                                 content=result.content,
-                                filename=result.metadata.get("title", result.url),
+                                filename=page_title,
                                 collection_name=collection,
                                 metadata=page_metadata,
                                 file_type="web_page",
@@ -609,7 +621,7 @@ def ingest_url(
                             total_chunks += len(chunk_ids)
                             successful_ingests += 1
                             console.print(
-                                f"  ✓ Page {i}/{len(results)}: {result.metadata.get('title', result.url)[:50]}... "
+                                f"  ✓ {page_label} "
                                 f"({len(chunk_ids)} chunks, depth={result.metadata.get('crawl_depth', 0)})"
                             )
 
@@ -747,4 +759,4 @@ def ingest_url(
             traceback.print_exc()
             sys.exit(1)
 
-    asyncio.run(run_ingest())
+    run_async(run_ingest())
@@ -1,10 +1,12 @@
 """Database initialization command."""
 
-import asyncio
 import sys
+
 import click
 from rich.console import Console
 
+from src.core.event_loop import run_async
+
 console = Console()
 
 
@@ -23,7 +25,7 @@ def init_command():
         rag init                    # Initialize both databases
         python scripts/setup.py     # Calls this automatically
     """
-    asyncio.run(init_databases())
+    run_async(init_databases())
 
 
 async def init_databases():
@@ -20,6 +20,10 @@ SERVICE_CONTAINERS = {
     'backup': 'rag-memory-backup-local',
 }
 
+# Section rules for exported reports (built once, not per section)
+SECTION_RULE = "=" * 80
+SUBSECTION_RULE = "-" * 80
+
 
 def check_docker_running() -> bool:
     """Check if Docker daemon is running."""
@@ -63,11 +67,13 @@ def export_logs_to_file(containers, tail, export_path):
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     version = get_rag_version()
 
-    with open(export_path, 'w') as f:
-        f.write(f"RAG Memory Log Export\n")
-        f.write(f"Generated: {timestamp}\n")
-        f.write(f"Version: {version}\n")
-        f.write(f"{'='*80}\n\n")
+    with open(export_path, 'w', encoding='utf-8') as f:
+        f.writelines([
+            "RAG Memory Log Export\n",
+            f"Generated: {timestamp}\n",
+            f"Version: {version}\n",
+            f"{SECTION_RULE}\n\n",
+        ])
 
         for service_name, container_name in containers:
             # Get logs for this container
@@ -78,20 +84,25 @@ def export_logs_to_file(containers, tail, export_path):
                 check=False
             )
 
-            f.write(f"\n{'='*80}\n")
-            f.write(f"{service_name.upper()} ({container_name})\n")
-            f.write(f"{'='*80}\n\n")
+            # Assemble this container's section and hand it to the file in one call
+            section = [
+                f"\n{SECTION_RULE}\n",
+                f"{service_name.upper()} ({container_name})\n",
+                f"{SECTION_RULE}\n\n",
+            ]
 
             if result.returncode == 0:
-                f.write(result.stdout)
+                section.append(result.stdout)
                 if result.stderr:
-                    f.write("\n--- STDERR ---\n")
-                    f.write(result.stderr)
+                    section.extend(["\n--- STDERR ---\n", result.stderr])
             else:
-                f.write(f"Error: Failed to get logs (exit code {result.returncode})\n")
-                f.write(result.stderr)
+                section.extend([
+                    f"Error: Failed to get logs (exit code {result.returncode})\n",
+                    result.stderr,
+                ])
 
-            f.write("\n")
+            section.append("\n")
+            f.writelines(section)
 
 
 def export_all_to_archive(containers, tail, archive_path):
@@ -103,25 +114,25 @@ def export_all_to_archive(containers, tail, archive_path):
         tmppath = Path(tmpdir)
 
         # Create system info file
-        with open(tmppath / "system_info.txt", 'w') as f:
-            f.write(f"RAG Memory System Report\n")
-            f.write(f"Generated: {timestamp}\n")
-            f.write(f"Version: {version}\n")
-            f.write(f"{'='*80}\n\n")
-
-            # Docker version
-            result = subprocess.run(["docker", "version"], capture_output=True, text=True, check=False)
-            f.write("DOCKER VERSION\n")
-            f.write("-"*80 + "\n")
-            f.write(result.stdout)
-            f.write("\n\n")
-
-            # Docker ps
-            result = subprocess.run(["docker", "ps", "-a"], capture_output=True, text=True, check=False)
-            f.write("DOCKER CONTAINERS\n")
-            f.write("-"*80 + "\n")
-            f.write(result.stdout)
-            f.write("\n\n")
+        docker_version = subprocess.run(["docker", "version"], capture_output=True, text=True, check=False)
+        docker_ps = subprocess.run(["docker", "ps", "-a"], capture_output=True, text=True, check=False)
+        (tmppath / "system_info.txt").write_text(
+            "".join([
+                "RAG Memory System Report\n",
+                f"Generated: {timestamp}\n",
+                f"Version: {version}\n",
+                f"{SECTION_RULE}\n\n",
+                "DOCKER VERSION\n",
+                f"{SUBSECTION_RULE}\n",
+                docker_version.stdout,
+                "\n\n",
+                "DOCKER CONTAINERS\n",
+                f"{SUBSECTION_RULE}\n",
+                docker_ps.stdout,
+                "\n\n",
+            ]),
+            encoding='utf-8',
+        )
 
         # Export logs for each container
         for service_name, container_name in containers:
@@ -132,20 +143,23 @@ def export_all_to_archive(containers, tail, archive_path):
                 check=False
             )
 
-            log_file = tmppath / f"{service_name}_logs.txt"
-            with open(log_file, 'w') as f:
-                f.write(f"{service_name.upper()} Logs\n")
-                f.write(f"Container: {container_name}\n")
-                f.write(f"{'='*80}\n\n")
-
-                if result.returncode == 0:
-                    f.write(result.stdout)
-                    if result.stderr:
-                        f.write("\n--- STDERR ---\n")
-                        f.write(result.stderr)
-                else:
-                    f.write(f"Error: Failed to get logs (exit code {result.returncode})\n")
-                    f.write(result.stderr)
+            parts = [
+                f"{service_name.upper()} Logs\n",
+                f"Container: {container_name}\n",
+                f"{SECTION_RULE}\n\n",
+            ]
+
+            if result.returncode == 0:
+                parts.append(result.stdout)
+                if result.stderr:
+                    parts.extend(["\n--- STDERR ---\n", result.stderr])
+            else:
+                parts.extend([
+                    f"Error: Failed to get logs (exit code {result.returncode})\n",
+                    result.stderr,
+                ])
+
+            (tmppath / f"{service_name}_logs.txt").write_text("".join(parts), encoding='utf-8')
 
         # Create tar.gz archive
         with tarfile.open(archive_path, "w:gz") as tar:
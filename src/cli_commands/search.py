@@ -57,26 +57,27 @@ def search(query, collection, limit, threshold, metadata, verbose, show_source):
         console.print(f"\n[bold green]Found {len(results)} results:[/bold green]\n")
 
         for i, result in enumerate(results, 1):
-            console.print(f"[bold cyan]Result {i}:[/bold cyan]")
-            console.print(f"  Chunk ID: {result.chunk_id}")
-            console.print(f"  Source: {result.source_filename} (Doc ID: {result.source_document_id})")
-            console.print(f"  Chunk: {result.chunk_index + 1}")
-            console.print(
-                f"  Similarity: [bold green]{result.similarity:.4f}[/bold green]"
-            )
-            console.print(f"  Position: chars {result.char_start}-{result.char_end}")
+            # Build each result block and print it in one call
+            lines = [
+                f"[bold cyan]Result {i}:[/bold cyan]",
+                f"  Chunk ID: {result.chunk_id}",
+                f"  Source: {result.source_filename} (Doc ID: {result.source_document_id})",
+                f"  Chunk: {result.chunk_index + 1}",
+                f"  Similarity: [bold green]{result.similarity:.4f}[/bold green]",
+                f"  Position: chars {result.char_start}-{result.char_end}",
+            ]
 
             if verbose:
-                console.print(f"  Content:\n{result.content}")
+                lines.append(f"  Content:\n{result.content}")
                 if result.metadata:
-                    console.print(f"  Metadata: {json.dumps(result.metadata, indent=2)}")
+                    lines.append(f"  Metadata: {json.dumps(result.metadata, indent=2)}")
                 if show_source and result.source_content:
-                    console.print(f"  [dim]Full Source ({len(result.source_content)} chars)[/dim]")
+                    lines.append(f"  [dim]Full Source ({len(result.source_content)} chars)[/dim]")
             else:
                 preview_len = 150 if show_source else 100
-                console.print(f"  Preview: {result.content[:preview_len]}...")
+                lines.append(f"  Preview: {result.content[:preview_len]}...")
 
-            console.print()
+            console.print("\n".join(lines) + "\n")
 
     except Exception as e:
         console.print(f"[bold red]Error: {e}[/bold red]")
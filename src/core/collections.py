@@ -2,6 +2,7 @@
 
 import logging
 from typing import List, Optional
+from psycopg.errors import UniqueViolation
 from psycopg.types.json import Jsonb
 
 from src.core.database import Database
@@ -108,9 +109,9 @@ class CollectionManager:
                     f"custom fields: {len(complete_schema['custom'])}"
                 )
                 return collection_id
+        except UniqueViolation:
+            raise ValueError(f"Collection '{name}' already exists")
         except Exception as e:
-            if "unique" in str(e).lower():
-                raise ValueError(f"Collection '{name}' already exists")
             logger.error(f"Failed to create collection: {e}")
             raise
 
@@ -480,34 +481,16 @@ class CollectionManager:
 
             # Delete Neo4j episodes if graph_store provided
             if graph_store:
-                import asyncio
-                deleted_episodes = 0
-                failed_episodes = 0
-
                 logger.info(f"Deleting {len(source_doc_ids)} episodes from Knowledge Graph...")
 
-                async def delete_all_episodes():
-                    nonlocal deleted_episodes, failed_episodes
-                    for doc_id in source_doc_ids:
-                        episode_name = f"doc_{doc_id}"
-                        try:
-                            success = await graph_store.delete_episode_by_name(episode_name)
-                            if success:
-                                deleted_episodes += 1
-                            else:
-                                # Episode not found in graph (may not have been ingested)
-                                logger.debug(f"Episode '{episode_name}' not found in graph (skipped)")
-                        except Exception as e:
-                            logger.warning(f"Failed to delete episode '{episode_name}': {e}")
-                            failed_episodes += 1
-
-                # Run async deletion
-                await delete_all_episodes()
+                counts = await graph_store.delete_episodes_by_names(
+                    [f"doc_{doc_id}" for doc_id in source_doc_ids]
+                )
 
                 logger.info(
-                    f"Graph cleanup complete: {deleted_episodes} episodes deleted, "
-                    f"{failed_episodes} failures, "
-                    f"{len(source_doc_ids) - deleted_episodes - failed_episodes} not found"
+                    f"Graph cleanup complete: {counts['deleted']} episodes deleted, "
+                    f"{counts['failed']} failures, "
+                    f"{counts['not_found']} not found"
                 )
 
             # Delete the collection (CASCADE removes chunk_collections)
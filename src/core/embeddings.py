@@ -2,6 +2,7 @@
 
 import logging
 import os
+from functools import lru_cache
 from typing import List
 
 import numpy as np
@@ -13,6 +14,25 @@ from openai import OpenAI
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_openai_client(api_key: str) -> OpenAI:
+    """
+    Get a shared OpenAI client for an API key.
+
+    The client owns an HTTP connection pool. Sharing it means every EmbeddingGenerator
+    (CLI commands, MCP server, test fixtures) reuses warm keep-alive connections instead
+    of opening a new pool per instance. A process uses one key, so only the latest
+    key's client is kept.
+
+    Args:
+        api_key: OpenAI API key.
+
+    Returns:
+        Cached OpenAI client for the key.
+    """
+    return OpenAI(api_key=api_key)
+
+
 class EmbeddingGenerator:
     """Generates and normalizes embeddings using OpenAI's API."""
 
@@ -32,7 +52,7 @@ class EmbeddingGenerator:
                 "Linux: ~/.config/rag-memory/, Windows: %LOCALAPPDATA%\\rag-memory\\)"
             )
 
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = _get_openai_client(self.api_key)
         self.model = model
         logger.info(f"EmbeddingGenerator initialized with model: {model}")
 
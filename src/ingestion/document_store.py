@@ -15,6 +15,9 @@ from src.core.embeddings import EmbeddingGenerator
 
 logger = logging.getLogger(__name__)
 
+# Number of chunks embedded per OpenAI request (API accepts up to 2048 inputs per call)
+EMBEDDING_BATCH_SIZE = 100
+
 
 class DocumentStore:
     """Manage full documents and their chunks."""
@@ -113,33 +116,80 @@ class DocumentStore:
         logger.info(f"Chunking document ({len(content)} chars)...")
         chunks = self.chunker.chunk_text(content, metadata)
 
-        stats = self.chunker.get_stats(chunks)
-        logger.info(
-            f"Created {stats['num_chunks']} chunks. "
-            f"Avg: {stats['avg_chunk_size']:.0f} chars, "
-            f"Range: {stats['min_chunk_size']}-{stats['max_chunk_size']}"
-        )
+        # Chunk stats only feed this log line - skip the pass over the chunks when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            stats = self.chunker.get_stats(chunks)
+            logger.info(
+                f"Created {stats['num_chunks']} chunks. "
+                f"Avg: {stats['avg_chunk_size']:.0f} chars, "
+                f"Range: {stats['min_chunk_size']}-{stats['max_chunk_size']}"
+            )
 
         # 4. Generate embeddings and store chunks
-        chunk_ids = []
-        for chunk_doc in chunks:
-            # Generate embedding for this chunk
-            embedding = self.embedder.generate_embedding(
-                chunk_doc.page_content, normalize=True
-            )
+        chunk_ids = self._store_chunks(conn, source_id, chunks, [collection["id"]])
 
-            # embedding is already a list from normalize_embedding() - pass directly to pgvector
-            # (numpy 2.x breaks when passing np.array to psycopg3)
-            # Store chunk
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO document_chunks
-                    (source_document_id, chunk_index, content,
-                     char_start, char_end, metadata, embedding)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    RETURNING id
-                    """,
+        logger.info(f"✅ Ingested document {source_id} with {len(chunk_ids)} chunks")
+
+        return source_id, chunk_ids
+
+    def _embed_chunks(self, chunks: List[Any]) -> List[List[float]]:
+        """
+        Generate normalized embeddings for chunks in batched API calls.
+
+        Args:
+            chunks: LangChain Documents produced by the chunker
+
+        Returns:
+            List of embeddings, aligned one-to-one with chunks
+        """
+        texts = [chunk_doc.page_content for chunk_doc in chunks]
+        embeddings = []
+        for start in range(0, len(texts), EMBEDDING_BATCH_SIZE):
+            batch = texts[start:start + EMBEDDING_BATCH_SIZE]
+            batch_embeddings = self.embedder.generate_embeddings(batch, normalize=True)
+            # generate_embeddings drops blank texts - a short batch would misalign chunks
+            if len(batch_embeddings) != len(batch):
+                raise ValueError("Cannot generate embedding for empty text")
+            embeddings.extend(batch_embeddings)
+        return embeddings
+
+    def _store_chunks(
+        self,
+        conn,
+        source_id: int,
+        chunks: List[Any],
+        collection_ids: List[int],
+    ) -> List[int]:
+        """
+        Embed chunks, insert them, and link them to collections.
+
+        Args:
+            conn: Database connection
+            source_id: Source document ID the chunks belong to
+            chunks: LangChain Documents produced by the chunker
+            collection_ids: Collections to link every chunk to
+
+        Returns:
+            List of inserted chunk IDs, in chunk order
+        """
+        if not chunks:
+            return []
+
+        embeddings = self._embed_chunks(chunks)
+
+        # embeddings are already lists from normalize_embedding() - pass directly to pgvector
+        # (numpy 2.x breaks when passing np.array to psycopg3)
+        chunk_ids = []
+        with conn.cursor() as cur:
+            cur.executemany(
+                """
+                INSERT INTO document_chunks
+                (source_document_id, chunk_index, content,
+                 char_start, char_end, metadata, embedding)
+                VALUES (%s, %s, %s, %s, %s, %s, %s)
+                RETURNING id
+                """,
+                [
                     (
                         source_id,
                         chunk_doc.metadata.get("chunk_index", 0),
@@ -148,24 +198,27 @@ class DocumentStore:
                         chunk_doc.metadata.get("char_end", 0),
                         Jsonb(chunk_doc.metadata),
                         embedding,
-                    ),
-                )
-                chunk_id = cur.fetchone()[0]
-                chunk_ids.append(chunk_id)
-
-            # Link chunk to collection
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO chunk_collections (chunk_id, collection_id)
-                    VALUES (%s, %s)
-                    """,
-                    (chunk_id, collection["id"]),
+                    )
+                    for chunk_doc, embedding in zip(chunks, embeddings)
+                ],
+                returning=True,
+            )
+            while True:
+                chunk_ids.append(cur.fetchone()[0])
+                if not cur.nextset():
+                    break
+
+            if collection_ids:
+                cur.executemany(
+                    "INSERT INTO chunk_collections (chunk_id, collection_id) VALUES (%s, %s)",
+                    [
+                        (chunk_id, collection_id)
+                        for chunk_id in chunk_ids
+                        for collection_id in collection_ids
+                    ],
                 )
 
-        logger.info(f"✅ Ingested document {source_id} with {len(chunk_ids)} chunks")
-
-        return source_id, chunk_ids
+        return chunk_ids
 
     def ingest_file(
         self,
@@ -354,6 +407,23 @@ class DocumentStore:
             cur.execute(query, params)
             results = cur.fetchall()
 
+        # Collections for every document on this page in one query (instead of one per document)
+        collections_by_doc: Dict[int, List[str]] = {}
+        if include_details and results:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT DISTINCT dc.source_document_id, c.name
+                    FROM collections c
+                    JOIN chunk_collections cc ON cc.collection_id = c.id
+                    JOIN document_chunks dc ON dc.id = cc.chunk_id
+                    WHERE dc.source_document_id = ANY(%s)
+                    """,
+                    ([row[0] for row in results],)
+                )
+                for doc_id, collection in cur.fetchall():
+                    collections_by_doc.setdefault(doc_id, []).append(collection)
+
         # Build document list
         documents = []
         for row in results:
@@ -367,21 +437,8 @@ class DocumentStore:
                     "updated_at": row[5],
                     "metadata": row[6] or {},
                     "chunk_count": row[7],
+                    "collections": collections_by_doc.get(row[0], []),
                 }
-
-                # Get collections for this document
-                with conn.cursor() as cur:
-                    cur.execute(
-                        """
-                        SELECT DISTINCT c.name
-                        FROM collections c
-                        JOIN chunk_collections cc ON cc.collection_id = c.id
-                        JOIN document_chunks dc ON dc.id = cc.chunk_id
-                        WHERE dc.source_document_id = %s
-                        """,
-                        (row[0],)
-                    )
-                    doc["collections"] = [r[0] for r in cur.fetchall()]
             else:
                 # Minimal response
                 doc = {
@@ -441,6 +498,35 @@ class DocumentStore:
 
             return chunks
 
+    def get_document_collections(self, document_id: int) -> List[Tuple[int, str]]:
+        """
+        Get the collections a source document's chunks are linked to.
+
+        The statement is sent with prepare=True so Postgres reuses its plan
+        across the update, delete and re-index paths that all call it.
+
+        Args:
+            document_id: Source document ID
+
+        Returns:
+            List of (collection_id, collection_name) tuples
+        """
+        conn = self.db.connect()
+
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT DISTINCT c.id, c.name
+                FROM collections c
+                JOIN chunk_collections cc ON cc.collection_id = c.id
+                JOIN document_chunks dc ON dc.id = cc.chunk_id
+                WHERE dc.source_document_id = %s
+                """,
+                (document_id,),
+                prepare=True,
+            )
+            return cur.fetchall()
+
     async def update_document(
         self,
         document_id: int,
@@ -532,18 +618,7 @@ class DocumentStore:
             old_chunk_count = len(old_chunks)
 
             # Get collections this document belongs to (before deleting chunks)
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    SELECT DISTINCT c.id, c.name
-                    FROM collections c
-                    JOIN chunk_collections cc ON cc.collection_id = c.id
-                    JOIN document_chunks dc ON dc.id = cc.chunk_id
-                    WHERE dc.source_document_id = %s
-                    """,
-                    (document_id,)
-                )
-                collections = cur.fetchall()
+            collections = self.get_document_collections(document_id)
 
             logger.info(f"Deleting {old_chunk_count} old chunks for document {document_id}")
 
@@ -566,53 +641,18 @@ class DocumentStore:
             # Re-chunk the document
             chunks = self.chunker.chunk_text(content, doc['metadata'])
 
-            stats = self.chunker.get_stats(chunks)
-            logger.info(
-                f"Created {stats['num_chunks']} new chunks. "
-                f"Avg: {stats['avg_chunk_size']:.0f} chars, "
-                f"Range: {stats['min_chunk_size']}-{stats['max_chunk_size']}"
-            )
-
-            # Store new chunks with embeddings
-            new_chunk_ids = []
-            for chunk_doc in chunks:
-                # Generate embedding
-                embedding = self.embedder.generate_embedding(
-                    chunk_doc.page_content, normalize=True
+            if logger.isEnabledFor(logging.INFO):
+                stats = self.chunker.get_stats(chunks)
+                logger.info(
+                    f"Created {stats['num_chunks']} new chunks. "
+                    f"Avg: {stats['avg_chunk_size']:.0f} chars, "
+                    f"Range: {stats['min_chunk_size']}-{stats['max_chunk_size']}"
                 )
 
-                # embedding is already a list from normalize_embedding() - pass directly to pgvector
-                # (numpy 2.x breaks when passing np.array to psycopg3)
-                # Insert chunk
-                with conn.cursor() as cur:
-                    cur.execute(
-                        """
-                        INSERT INTO document_chunks
-                        (source_document_id, chunk_index, content,
-                         char_start, char_end, metadata, embedding)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s)
-                        RETURNING id
-                        """,
-                        (
-                            document_id,
-                            chunk_doc.metadata.get("chunk_index", 0),
-                            chunk_doc.page_content,
-                            chunk_doc.metadata.get("char_start", 0),
-                            chunk_doc.metadata.get("char_end", 0),
-                            Jsonb(chunk_doc.metadata),
-                            embedding,
-                        ),
-                    )
-                    chunk_id = cur.fetchone()[0]
-                    new_chunk_ids.append(chunk_id)
-
-                # Re-link to all collections the document belonged to
-                for coll_id, coll_name in collections:
-                    with conn.cursor() as cur:
-                        cur.execute(
-                            "INSERT INTO chunk_collections (chunk_id, collection_id) VALUES (%s, %s)",
-                            (chunk_id, coll_id)
-                        )
+            # Store new chunks with embeddings, re-linked to all collections the document belonged to
+            new_chunk_ids = self._store_chunks(
+                conn, document_id, chunks, [coll_id for coll_id, _ in collections]
+            )
 
             new_chunk_count = len(new_chunk_ids)
             updated_fields.append("content")
@@ -675,44 +715,37 @@ class DocumentStore:
                 logger.warning(f"⚠️  Graph episode '{episode_name}' not found (may not have been indexed)")
 
 
-        chunks = self.get_document_chunks(document_id)
-
         # Get affected collections
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT DISTINCT c.name
-                FROM collections c
-                JOIN chunk_collections cc ON cc.collection_id = c.id
-                JOIN document_chunks dc ON dc.id = cc.chunk_id
-                WHERE dc.source_document_id = %s
-                """,
-                (document_id,)
-            )
-            collections_affected = [row[0] for row in cur.fetchall()]
+        collections_affected = [
+            name for _, name in self.get_document_collections(document_id)
+        ]
 
-        logger.info(f"Deleting document {document_id} ('{doc['filename']}') with {len(chunks)} chunks")
+        logger.info(f"Deleting document {document_id} ('{doc['filename']}')")
 
-        # Delete chunks (cascade will handle chunk_collections)
         with conn.cursor() as cur:
+            # Delete chunks (cascade will handle chunk_collections); the row count is the
+            # number of chunks removed, so the chunks don't need to be fetched beforehand
             cur.execute(
                 "DELETE FROM document_chunks WHERE source_document_id = %s",
                 (document_id,)
             )
+            chunks_deleted = cur.rowcount
 
-        # Delete source document
-        with conn.cursor() as cur:
+            # Delete source document
             cur.execute(
                 "DELETE FROM source_documents WHERE id = %s",
                 (document_id,)
             )
 
-        logger.info(f"✅ Deleted document {document_id} from collections: {collections_affected}")
+        logger.info(
+            f"✅ Deleted document {document_id} with {chunks_deleted} chunks "
+            f"from collections: {collections_affected}"
+        )
 
         return {
             "document_id": document_id,
             "document_title": doc["filename"],
-            "chunks_deleted": len(chunks),
+            "chunks_deleted": chunks_deleted,
             "collections_affected": collections_affected,
             "graph_episode_deleted": graph_episode_deleted
         }
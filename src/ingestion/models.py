@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class CrawlError:
     """Represents an error that occurred during crawling."""
 
@@ -26,7 +26,7 @@ class CrawlError:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CrawlResult:
     """Represents the result of crawling a single page."""
 
@@ -52,7 +52,7 @@ class CrawlResult:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchCrawlResult:
     """Represents the result of crawling multiple pages."""
 
@@ -6,6 +6,7 @@ import sys
 import uuid
 from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, List, Optional, Set
 from urllib.parse import urlparse, urljoin
 
@@ -23,6 +24,41 @@ from src.ingestion.models import CrawlError, CrawlResult
 
 logger = logging.getLogger(__name__)
 
+# Content filter to remove navigation noise and reduce document-to-document relationships
+# in knowledge graph extraction. Uses algorithmic text density + link density scoring.
+# Issue: Web pages contain navigation elements (links, breadcrumbs, sidebars) that confuse
+# Graphiti's LLM-based entity extraction, causing extraction of document structure instead of
+# semantic relationships. PruningContentFilter removes ~50-55% of navigation clutter while
+# preserving 100% of valuable documentation content.
+# See: Issue 10 in TASKS_AND_ISSUES.md for detailed analysis
+#
+# The filter and generator hold no per-page state, so one generator per distinct filter
+# configuration is built and shared by every WebCrawler instead of being reconstructed per crawl.
+@lru_cache(maxsize=None)
+def get_markdown_generator(
+    threshold: float = 0.40,
+    threshold_type: str = "fixed",
+    min_word_threshold: int = 5,
+) -> DefaultMarkdownGenerator:
+    """
+    Get a shared markdown generator wrapping a PruningContentFilter.
+
+    Args:
+        threshold: Pruning score threshold (0.35-0.40 is more permissive for documentation sites)
+        threshold_type: "fixed" (predictable) or "dynamic"
+        min_word_threshold: Minimum words for a content block to be kept
+
+    Returns:
+        Cached DefaultMarkdownGenerator for the given filter settings
+    """
+    content_filter = PruningContentFilter(
+        threshold=threshold,
+        threshold_type=threshold_type,
+        min_word_threshold=min_word_threshold,
+    )
+    # Wrap filter in markdown generator (filter must be passed through generator, not directly)
+    return DefaultMarkdownGenerator(content_filter=content_filter)
+
 
 @contextmanager
 def suppress_crawl4ai_stdout():
@@ -74,23 +110,8 @@ class WebCrawler:
             ],
         )
 
-        # Content filter to remove navigation noise and reduce document-to-document relationships
-        # in knowledge graph extraction. Uses algorithmic text density + link density scoring.
-        # Issue: Web pages contain navigation elements (links, breadcrumbs, sidebars) that confuse
-        # Graphiti's LLM-based entity extraction, causing extraction of document structure instead of
-        # semantic relationships. PruningContentFilter removes ~50-55% of navigation clutter while
-        # preserving 100% of valuable documentation content.
-        # See: Issue 10 in TASKS_AND_ISSUES.md for detailed analysis
-        content_filter = PruningContentFilter(
-            threshold=0.40,           # Lower threshold (0.35-0.40) more permissive for documentation sites
-            threshold_type="fixed",   # Fixed mode is more predictable than dynamic
-            min_word_threshold=5      # Keep small but meaningful content blocks
-        )
-
-        # Wrap filter in markdown generator (filter must be passed through generator, not directly)
-        self.markdown_generator = DefaultMarkdownGenerator(
-            content_filter=content_filter
-        )
+        # Shared markdown generator with PruningContentFilter (see get_markdown_generator)
+        self.markdown_generator = get_markdown_generator()
 
         # Crawler run configuration (for single-page crawls)
         self.crawler_config = CrawlerRunConfig(
@@ -136,21 +157,9 @@ class WebCrawler:
                     )
 
                     if not result.success:
-                        error = CrawlError(
-                            url=url,
-                            error_type="crawl_failed",
-                            error_message=result.error_message or "Unknown error",
-                            timestamp=crawl_timestamp,
-                            status_code=result.status_code,
-                        )
-                        logger.error(f"Failed to crawl {url}: {error.error_message}")
-                        return CrawlResult(
-                            url=url,
-                            content="",
-                            metadata={},
-                            success=False,
-                            error=error,
-                        )
+                        failed = self._failed_result(url, crawl_timestamp, result=result)
+                        logger.error(f"Failed to crawl {url}: {failed.error.error_message}")
+                        return failed
 
                     # Extract metadata
                     metadata = self._build_metadata(
@@ -177,24 +186,53 @@ class WebCrawler:
                         content=content,
                         metadata=metadata,
                         success=True,
-                        links_found=result.links.get("internal", []) if result.links else [],
+                        links_found=self._internal_links(result),
                     )
 
         except Exception as e:
+            logger.exception(f"Exception while crawling {url}")
+            return self._failed_result(url, crawl_timestamp, exception=e)
+
+    @staticmethod
+    def _failed_result(
+        url: str,
+        timestamp: datetime,
+        result=None,
+        exception: Optional[Exception] = None,
+    ) -> CrawlResult:
+        """
+        Build a failed CrawlResult from either a failed Crawl4AI result or an exception.
+
+        Args:
+            url: URL that failed
+            timestamp: Timestamp of the crawl
+            result: Optional failed Crawl4AI result object
+            exception: Optional exception raised while crawling
+
+        Returns:
+            CrawlResult with success=False and a populated CrawlError
+        """
+        if exception is not None:
             error = CrawlError(
                 url=url,
-                error_type=type(e).__name__,
-                error_message=str(e),
-                timestamp=crawl_timestamp,
+                error_type=type(exception).__name__,
+                error_message=str(exception),
+                timestamp=timestamp,
             )
-            logger.exception(f"Exception while crawling {url}")
-            return CrawlResult(
+        else:
+            error = CrawlError(
                 url=url,
-                content="",
-                metadata={},
-                success=False,
-                error=error,
+                error_type="crawl_failed",
+                error_message=result.error_message or "Unknown error",
+                timestamp=timestamp,
+                status_code=result.status_code,
             )
+        return CrawlResult(url=url, content="", metadata={}, success=False, error=error)
+
+    @staticmethod
+    def _internal_links(result) -> List[str]:
+        """Return the internal links Crawl4AI found on a page (empty if none)."""
+        return result.links.get("internal", []) if result.links else []
 
     def _build_metadata(
         self,
@@ -222,6 +260,8 @@ class WebCrawler:
             Metadata dictionary
         """
         parsed = urlparse(url)
+        raw_length = len(result.markdown.raw_markdown)
+        filtered_length = len(result.markdown.fit_markdown or "")
 
         metadata = {
             # PAGE IDENTITY
@@ -239,7 +279,10 @@ class WebCrawler:
             # OPTIONAL BUT USEFUL
             "language": result.metadata.get("language", "en"),
             "status_code": result.status_code,
-            "content_length": len(result.markdown.raw_markdown),
+            # Both sizes come from the same fetch - crawl4ai produces raw and filtered markdown
+            # in one pass, so measuring the filter never needs a second, unfiltered crawl
+            "content_length": raw_length,
+            "filtered_content_length": filtered_length,
             "crawler_version": "crawl4ai-0.7.4",
         }
 
@@ -339,34 +382,22 @@ class WebCrawler:
                                     content=crawl_result.markdown.fit_markdown or crawl_result.markdown.raw_markdown,  # Use filtered if available, fallback to raw
                                     metadata=metadata,
                                     success=True,
-                                    links_found=(
-                                        crawl_result.links.get("internal", [])
-                                        if crawl_result.links
-                                        else []
-                                    ),
+                                    links_found=self._internal_links(crawl_result),
                                 )
                             )
-                            logger.info(
-                                f"Successfully crawled page {page_url} (depth={depth}, {len(crawl_result.markdown.raw_markdown)} chars)"
+                            # Per-page detail is DEBUG with lazy args; the summary below stays at INFO
+                            logger.debug(
+                                "Successfully crawled page %s (depth=%d, %d chars)",
+                                page_url, depth, metadata['content_length']
                             )
                         else:
-                            error = CrawlError(
-                                url=page_url,
-                                error_type="crawl_failed",
-                                error_message=crawl_result.error_message or "Unknown error",
-                                timestamp=crawl_timestamp,
-                                status_code=crawl_result.status_code,
+                            failed = self._failed_result(
+                                page_url, crawl_timestamp, result=crawl_result
                             )
-                            results.append(
-                                CrawlResult(
-                                    url=page_url,
-                                    content="",
-                                    metadata={},
-                                    success=False,
-                                    error=error,
-                                )
+                            results.append(failed)
+                            logger.warning(
+                                "Failed to crawl %s: %s", page_url, failed.error.error_message
                             )
-                            logger.warning(f"Failed to crawl {page_url}: {error.error_message}")
 
                         # Increment depth for next page
                         depth += 1
@@ -378,24 +409,10 @@ class WebCrawler:
                     return results
 
         except Exception as e:
-            error = CrawlError(
-                url=url,
-                error_type=type(e).__name__,
-                error_message=str(e),
-                timestamp=crawl_timestamp,
-            )
             logger.exception(f"Exception during deep crawl from {url}")
             # Return whatever we managed to crawl plus the error
             if not results:
-                results.append(
-                    CrawlResult(
-                        url=url,
-                        content="",
-                        metadata={},
-                        success=False,
-                        error=error,
-                    )
-                )
+                results.append(self._failed_result(url, crawl_timestamp, exception=e))
             return results
 
 
@@ -115,7 +115,7 @@ class WebsiteAnalyzer:
             logger.error(f"Website analysis error for {self.base_url}: {error_type}: {error_msg}")
 
             # Map Python exceptions to generic error codes
-            if "URL" in error_type or "url" in str(e).lower():
+            if "URL" in error_type or "url" in error_msg.lower():
                 error_code = "invalid_url"
                 user_message = f"Invalid or malformed URL. {error_msg}"
             elif any(x in error_type for x in ["Connect", "Network", "Socket", "DNS", "Timeout"]):
@@ -145,7 +145,7 @@ class WebsiteAnalyzer:
 
         Separated from analyze_async to isolate timeout handling.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Use AsyncUrlSeeder with sitemap+cc source
         async with AsyncUrlSeeder() as seeder:
@@ -160,7 +160,7 @@ class WebsiteAnalyzer:
             # Fetch URLs from sitemap or Common Crawl
             urls = await seeder.urls(self.domain, config)
 
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
 
         if not urls:
             # No URLs discovered
@@ -202,11 +202,7 @@ class WebsiteAnalyzer:
         )
 
         # Extract domains
-        domains = set()
-        for url in url_strings:
-            parsed = urlparse(url)
-            if parsed.netloc:
-                domains.add(parsed.netloc)
+        domains = {urlparse(url).netloc for url in url_strings} - {""}
 
         # Build response
         result = {
@@ -226,7 +222,7 @@ class WebsiteAnalyzer:
         if include_url_lists:
             limited_url_groups = {}
             for pattern, urls_list in url_groups.items():
-                sorted_urls = sorted(urls_list, key=lambda u: len(urlparse(u).path))
+                sorted_urls = self._sort_by_path_length(urls_list)
                 limited_url_groups[pattern] = sorted_urls[:max_urls_per_pattern]
             result["url_groups"] = limited_url_groups
             result["notes"] += f" Full URL lists included (max {max_urls_per_pattern} URLs per pattern)."
@@ -252,15 +248,11 @@ class WebsiteAnalyzer:
             parsed = urlparse(url)
             path = parsed.path.rstrip('/')
 
-            if not path or path == '/':
-                pattern = "/"
-            else:
-                segments = path.split('/')
-                pattern = f"/{segments[1]}" if len(segments) > 1 else "/"
+            # Only the first segment matters, so partition instead of splitting the whole path
+            _, sep, rest = path.partition('/')
+            pattern = f"/{rest.partition('/')[0]}" if sep else "/"
 
-            if pattern not in groups:
-                groups[pattern] = []
-            groups[pattern].append(url)
+            groups.setdefault(pattern, []).append(url)
 
         return groups
 
@@ -277,18 +269,16 @@ class WebsiteAnalyzer:
         stats = {}
 
         for pattern, urls in url_groups.items():
+            # Parse each URL once; the path feeds both the depth and the example ordering
+            paths = {url: urlparse(url).path for url in urls}
+
             # Calculate average path depth
-            depths = []
-            for url in urls:
-                parsed = urlparse(url)
-                path = parsed.path.rstrip('/')
-                depth = len([s for s in path.split('/') if s])
-                depths.append(depth)
+            depths = [len([s for s in paths[url].split('/') if s]) for url in urls]
 
             avg_depth = sum(depths) / len(depths) if depths else 0
 
             # Get up to 3 example URLs (shortest ones = typically most important)
-            sorted_urls = sorted(urls, key=lambda u: len(urlparse(u).path))
+            sorted_urls = sorted(urls, key=lambda u: len(paths[u]))
             examples = sorted_urls[:3]
 
             stats[pattern] = {
@@ -299,6 +289,12 @@ class WebsiteAnalyzer:
 
         return stats
 
+    @staticmethod
+    def _sort_by_path_length(urls: List[str]) -> List[str]:
+        """Sort URLs by path length (shortest first), parsing each URL only once."""
+        paths = {url: urlparse(url).path for url in urls}
+        return sorted(urls, key=lambda u: len(paths[u]))
+
     def _error_response(
         self,
         status: str,
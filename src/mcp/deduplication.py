@@ -10,11 +10,17 @@ import hashlib
 import json
 import inspect
 import logging
-from datetime import datetime
-from typing import Optional, Dict, Any, Callable
+import time
+from typing import Optional, Dict, Any, Callable, Tuple
 import asyncio
 from functools import wraps
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,16 +53,30 @@ class RequestDeduplicator:
         # Populated once per function at decoration time
         self._signature_cache: Dict[Callable, inspect.Signature] = {}
 
+        # Names of the parameters that go into the request hash, per function.
+        # Also populated at decoration time so calls never re-filter ignored fields.
+        self._hashed_params_cache: Dict[Callable, Tuple[str, ...]] = {}
+
     def _get_signature(self, func: Callable) -> inspect.Signature:
         """Get function signature (cached after first call)."""
         if func not in self._signature_cache:
             self._signature_cache[func] = inspect.signature(func)
         return self._signature_cache[func]
 
+    def _get_hashed_params(self, func: Callable) -> Tuple[str, ...]:
+        """Get the parameter names that affect the logical request (cached after first call)."""
+        if func not in self._hashed_params_cache:
+            self._hashed_params_cache[func] = tuple(
+                param_name
+                for param_name in self._get_signature(func).parameters
+                if param_name not in self._ignored_fields
+            )
+        return self._hashed_params_cache[func]
+
     def _hash_request(
         self,
         tool_name: str,
-        func: Callable,
+        hashed_params: Tuple[str, ...],
         bound_args: inspect.BoundArguments
     ) -> str:
         """
@@ -64,43 +84,59 @@ class RequestDeduplicator:
 
         Args:
             tool_name: Name of the tool (for namespacing)
-            func: The function being called (for signature cache)
+            hashed_params: Parameter names to hash, from _get_hashed_params()
             bound_args: Bound arguments from sig.bind()
 
         Returns:
             16-character hex hash uniquely identifying this request
         """
-        normalized_params = {}
-
-        for param_name, value in bound_args.arguments.items():
-            # Skip client-preference fields (don't affect logical request)
-            if param_name in self._ignored_fields:
-                continue
+        arguments = bound_args.arguments
 
-            # Normalize value for deterministic hashing
-            if isinstance(value, dict):
-                # Sort dict keys for deterministic JSON
-                value = json.dumps(value, sort_keys=True)
-            elif isinstance(value, list):
-                # Convert list to tuple for hashability
-                value = tuple(value)
-
-            normalized_params[param_name] = value
+        # Client-preference fields were filtered out once, at decoration time
+        params = {
+            param_name: arguments[param_name]
+            for param_name in hashed_params
+            if param_name in arguments
+        }
 
-        # Create deterministic payload
-        payload = json.dumps({
-            'tool': tool_name,
-            'params': normalized_params
-        }, sort_keys=True, default=str)  # default=str handles non-JSON types
+        # Create deterministic payload. Sorted keys canonicalize nested dicts and
+        # lists/tuples serialize identically, so values need no pre-normalization.
+        # default=str handles non-JSON types.
+        request = {'tool': tool_name, 'params': params}
+        payload = None
+        if ORJSON_AVAILABLE:
+            try:
+                # Datetimes and dataclasses go through default=str, as in the stdlib path
+                payload = orjson.dumps(
+                    request,
+                    default=str,
+                    option=(
+                        orjson.OPT_SORT_KEYS
+                        | orjson.OPT_PASSTHROUGH_DATETIME
+                        | orjson.OPT_PASSTHROUGH_DATACLASS
+                    ),
+                )
+            except orjson.JSONEncodeError:
+                # e.g. non-str dict keys or integers beyond 64 bits, which the
+                # stdlib encoder accepts
+                payload = None
+        if payload is None:
+            # Compact, non-ASCII-escaped output: byte-identical to orjson for JSON values
+            payload = json.dumps(
+                request,
+                sort_keys=True,
+                default=str,
+                separators=(',', ':'),
+                ensure_ascii=False,
+            ).encode()
 
         # Return first 16 chars of SHA256 (sufficient for collision resistance)
-        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+        return hashlib.sha256(payload).hexdigest()[:16]
 
     async def check_and_register(
         self,
         tool_name: str,
-        func: Callable,
-        bound_args: inspect.BoundArguments
+        request_hash: str
     ) -> Optional[str]:
         """
         Check if this exact request is already processing.
@@ -109,18 +145,15 @@ class RequestDeduplicator:
 
         Args:
             tool_name: Name of the tool
-            func: The function being called
-            bound_args: Bound arguments
+            request_hash: Hash from _hash_request() for this call
 
         Returns:
             Error message if duplicate, None if okay to proceed
         """
-        request_hash = self._hash_request(tool_name, func, bound_args)
-
         async with self._lock:
             if request_hash in self._active_requests:
                 info = self._active_requests[request_hash]
-                elapsed = (datetime.now() - info['timestamp']).total_seconds()
+                elapsed = time.monotonic() - info['started']
 
                 logger.warning(
                     f"Duplicate request detected for {tool_name} "
@@ -133,8 +166,9 @@ class RequestDeduplicator:
                 )
 
             # Register as active
+            # Monotonic clock: elapsed times stay correct across wall-clock/NTP adjustments
             self._active_requests[request_hash] = {
-                'timestamp': datetime.now(),
+                'started': time.monotonic(),
                 'tool': tool_name
             }
 
@@ -144,16 +178,13 @@ class RequestDeduplicator:
     async def unregister(
         self,
         tool_name: str,
-        func: Callable,
-        bound_args: inspect.BoundArguments
+        request_hash: str
     ):
         """
         Remove request from tracking.
 
         Should be called in a finally block to ensure cleanup even on errors.
         """
-        request_hash = self._hash_request(tool_name, func, bound_args)
-
         async with self._lock:
             if request_hash in self._active_requests:
                 del self._active_requests[request_hash]
@@ -196,8 +227,10 @@ def deduplicate_request(tool_name: Optional[str] = None):
         # Use function name if tool_name not provided
         name = tool_name or func.__name__
 
-        # Cache signature at decoration time (happens once at server startup)
+        # Resolve signature and hashed parameter names once at decoration time
+        # (happens once at server startup) and keep them in this closure
         sig = _deduplicator._get_signature(func)
+        hashed_params = _deduplicator._get_hashed_params(func)
 
         @wraps(func)
         async def wrapper(*args, **kwargs):
@@ -205,8 +238,11 @@ def deduplicate_request(tool_name: Optional[str] = None):
             bound_args = sig.bind(*args, **kwargs)
             bound_args.apply_defaults()  # Fill in default values
 
+            # Hash once per call - the same hash registers and unregisters the request
+            request_hash = _deduplicator._hash_request(name, hashed_params, bound_args)
+
             # Check for duplicate
-            error = await _deduplicator.check_and_register(name, func, bound_args)
+            error = await _deduplicator.check_and_register(name, request_hash)
             if error:
                 logger.info(f"Rejected duplicate request for {name}")
                 return {'error': error, 'status': 'duplicate_request'}
@@ -217,7 +253,7 @@ def deduplicate_request(tool_name: Optional[str] = None):
                 return result
             finally:
                 # Always cleanup, even if function raises exception
-                await _deduplicator.unregister(name, func, bound_args)
+                await _deduplicator.unregister(name, request_hash)
 
         return wrapper
     return decorator
@@ -5,6 +5,7 @@ Exposes RAG functionality via Model Context Protocol for AI agents.
 """
 
 import logging
+import logging.handlers
 import os
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -18,6 +19,7 @@ from src.core.embeddings import get_embedding_generator
 from src.core.collections import get_collection_manager
 from src.core.first_run import ensure_config_or_exit
 from src.core.config_loader import load_environment_variables
+from src.core.event_loop import UVLOOP_AVAILABLE, run_async
 from src.retrieval.search import get_similarity_search
 from src.ingestion.document_store import get_document_store
 from src.unified import GraphStore, UnifiedIngestionMediator
@@ -57,11 +59,23 @@ def configure_logging():
     log_dir = Path(__file__).parent.parent.parent / "logs"
     log_dir.mkdir(exist_ok=True)
 
+    # DEBUG output is high-volume (crawl4ai, neo4j, per-chunk logs), so file records are
+    # buffered and written in batches. Any INFO-or-higher record flushes the buffer, so the
+    # file never lags behind meaningful events; the handler is flushed on shutdown.
+    log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_dir / "mcp_server.log")
+    file_handler.setFormatter(log_formatter)
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=256,
+        flushLevel=logging.INFO,
+        target=file_handler,
+    )
+
     logging.basicConfig(
         level=logging.DEBUG,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler(log_dir / "mcp_server.log"),
+            buffered_file_handler,
             logging.StreamHandler()  # Also log to stderr for debugging
         ]
     )
@@ -1320,7 +1334,6 @@ async def query_temporal(
 def main():
     """Run the MCP server with specified transport."""
     import sys
-    import asyncio
     import click
 
     # Configure logging when server starts (not at module import)
@@ -1368,7 +1381,11 @@ def main():
                 raise
 
         try:
-            asyncio.run(run_server())
+            # uvloop (optional "performance" extra) gives a faster event loop for the
+            # stdio/HTTP transports and crawl I/O; fall back to the stdlib loop otherwise
+            if UVLOOP_AVAILABLE:
+                logger.info("Using uvloop event loop")
+            run_async(run_server())
         except KeyboardInterrupt:
             logger.info("Server interrupted")
         except Exception as e:
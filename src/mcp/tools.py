@@ -6,12 +6,15 @@ MCP-compatible formats (JSON-serializable dicts).
 """
 
 import asyncio
+import copy
 import logging
 import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from src.core.config_loader import is_path_in_mounts
 from src.core.database import Database
 from src.core.collections import CollectionManager
 from src.retrieval.search import SimilaritySearch
@@ -23,14 +26,47 @@ from src.mcp.deduplication import deduplicate_request
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for optional edge attributes where None is a legitimate value
+_MISSING = object()
+
 # ============================================================================
-# Analysis Token Store (in-memory, ephemeral)
+# Website Analysis Cache (in-memory, ephemeral)
 # ============================================================================
-# Tokens are reusable, expire after 4 hours
+# Successful analyses are reusable and expire after 4 hours
 # Long expiry accounts for real-world usage: user reviews analysis, gets
 # distracted, comes back hours later to approve crawl
 # Reusable design supports multiple targeted crawls of same site without
-# redundant analysis calls
+# redundant analysis calls (each analysis can take up to 50 seconds)
+ANALYSIS_CACHE_TTL_SECONDS = 4 * 60 * 60
+
+# Each entry holds full URL lists, so keep only the most recently used analyses
+ANALYSIS_CACHE_MAX_ENTRIES = 32
+
+# (base_url, include_url_lists, max_urls_per_pattern) -> (cached_at, result)
+# Ordered by recency of use (least recently used first)
+_analysis_cache: OrderedDict[Tuple[str, bool, int], Tuple[float, Dict[str, Any]]] = OrderedDict()
+
+
+def _store_analysis(cache_key: Tuple[str, bool, int], result: Dict[str, Any]) -> None:
+    """
+    Cache a successful website analysis, evicting expired and least recently used entries.
+
+    Args:
+        cache_key: (base_url, include_url_lists, max_urls_per_pattern)
+        result: Successful analysis result (copied before caching)
+    """
+    now = time.monotonic()
+    expired = [
+        key for key, (cached_at, _) in _analysis_cache.items()
+        if now - cached_at >= ANALYSIS_CACHE_TTL_SECONDS
+    ]
+    for key in expired:
+        del _analysis_cache[key]
+
+    _analysis_cache[cache_key] = (now, copy.deepcopy(result))
+    _analysis_cache.move_to_end(cache_key)
+    while len(_analysis_cache) > ANALYSIS_CACHE_MAX_ENTRIES:
+        _analysis_cache.popitem(last=False)
 
 
 async def ensure_databases_healthy(
@@ -107,6 +143,8 @@ async def ensure_databases_healthy(
 # (e.g., add a new mode, change collection checks), we update ONE place
 # instead of 4 separate tool implementations.
 
+VALID_INGEST_MODES = frozenset({"ingest", "reingest"})
+
 
 def validate_mode(mode: str) -> None:
     """
@@ -121,7 +159,7 @@ def validate_mode(mode: str) -> None:
     Raises:
         ValueError: If mode is not valid
     """
-    if mode not in ["ingest", "reingest"]:
+    if mode not in VALID_INGEST_MODES:
         raise ValueError(f"Invalid mode '{mode}'. Must be 'ingest' or 'reingest'")
 
 
@@ -236,8 +274,8 @@ def search_documents_impl(
             results_list.append(result)
 
         return results_list
-    except Exception as e:
-        logger.error(f"search_documents failed: {e}")
+    except Exception:
+        logger.exception("search_documents failed")
         raise
 
 
@@ -258,8 +296,8 @@ def list_collections_impl(coll_mgr: CollectionManager) -> List[Dict[str, Any]]:
             }
             for c in collections
         ]
-    except Exception as e:
-        logger.error(f"list_collections failed: {e}")
+    except Exception:
+        logger.exception("list_collections failed")
         raise
 
 
@@ -450,8 +488,8 @@ def create_collection_impl(
     except ValueError as e:
         logger.warning(f"create_collection failed: {e}")
         raise
-    except Exception as e:
-        logger.error(f"create_collection failed: {e}")
+    except Exception:
+        logger.exception("create_collection failed")
         raise
 
 
@@ -566,8 +604,8 @@ def get_collection_metadata_schema_impl(
     except ValueError as e:
         logger.warning(f"get_collection_metadata_schema failed: {e}")
         raise
-    except Exception as e:
-        logger.error(f"get_collection_metadata_schema failed: {e}")
+    except Exception:
+        logger.exception("get_collection_metadata_schema failed")
         raise
 
 
@@ -621,6 +659,7 @@ async def delete_collection_impl(
 
         # Get source document IDs for graph cleanup BEFORE deletion
         source_doc_ids = []
+        source_doc_lookup_failed = False
         if graph_store and db:
             try:
                 conn = db.connect()
@@ -642,6 +681,7 @@ async def delete_collection_impl(
             except Exception as e:
                 logger.warning(f"Could not fetch source_doc_ids for graph cleanup: {e}")
                 source_doc_ids = []
+                source_doc_lookup_failed = True
 
         # Perform RAG deletion
         deleted = await coll_mgr.delete_collection(name)
@@ -653,14 +693,15 @@ async def delete_collection_impl(
 
         # Clean up graph episodes (Phase 4 implementation)
         deleted_episodes = 0
+        failed_episodes = 0
         if graph_store and source_doc_ids:
             try:
                 logger.info(f"Cleaning up {len(source_doc_ids)} episodes from graph...")
-                for doc_id in source_doc_ids:
-                    episode_name = f"doc_{doc_id}"
-                    deleted = await graph_store.delete_episode_by_name(episode_name)
-                    if deleted:
-                        deleted_episodes += 1
+                counts = await graph_store.delete_episodes_by_names(
+                    [f"doc_{doc_id}" for doc_id in source_doc_ids]
+                )
+                deleted_episodes = counts["deleted"]
+                failed_episodes = counts["failed"]
                 logger.info(
                     f"✅ Graph cleanup complete - {deleted_episodes} episodes deleted"
                 )
@@ -675,8 +716,17 @@ async def delete_collection_impl(
         )
         if deleted_episodes > 0:
             message += f" ({deleted_episodes} graph episodes cleaned)"
+            if failed_episodes > 0:
+                # Keep the partial result, but say exactly how much was left behind
+                message += f" (⚠️ {failed_episodes} graph episodes could not be deleted)"
         elif graph_store and source_doc_ids:
             message += " (⚠️ Graph cleanup attempted but may have issues)"
+        elif source_doc_lookup_failed:
+            # Don't report a clean delete when graph cleanup never ran
+            message += (
+                " (⚠️ Could not look up the collection's documents, so graph cleanup "
+                "was skipped; its graph episodes may remain)"
+            )
 
         return {
             "name": name,
@@ -686,8 +736,8 @@ async def delete_collection_impl(
     except ValueError as e:
         logger.warning(f"delete_collection failed: {e}")
         raise
-    except Exception as e:
-        logger.error(f"delete_collection failed: {e}")
+    except Exception:
+        logger.exception("delete_collection failed")
         raise
 
 
@@ -771,8 +821,8 @@ async def ingest_text_impl(
             result.pop("chunk_ids", None)
 
         return result
-    except Exception as e:
-        logger.error(f"ingest_text failed: {e}")
+    except Exception:
+        logger.exception("ingest_text failed")
         raise
 
 
@@ -811,8 +861,8 @@ def get_document_by_id_impl(
             ]
 
         return result
-    except Exception as e:
-        logger.error(f"get_document_by_id failed: {e}")
+    except Exception:
+        logger.exception("get_document_by_id failed")
         raise
 
 
@@ -892,8 +942,8 @@ def get_collection_info_impl(
             "sample_documents": sample_docs,
             "crawled_urls": crawled_urls,
         }
-    except Exception as e:
-        logger.error(f"get_collection_info failed: {e}")
+    except Exception:
+        logger.exception("get_collection_info failed")
         raise
 
 
@@ -941,6 +991,15 @@ async def analyze_website_impl(
         - domains: List of domains found in results
         - url_patterns: Number of URL pattern groups found
     """
+    cache_key = (base_url, include_url_lists, max_urls_per_pattern)
+    cached = _analysis_cache.get(cache_key)
+    if cached:
+        if time.monotonic() - cached[0] < ANALYSIS_CACHE_TTL_SECONDS:
+            _analysis_cache.move_to_end(cache_key)
+            logger.info(f"Returning cached website analysis for {base_url}")
+            return copy.deepcopy(cached[1])
+        del _analysis_cache[cache_key]
+
     try:
         # Call the async analyzer (ignoring deprecated timeout parameter)
         result = await analyze_website_async(
@@ -948,6 +1007,9 @@ async def analyze_website_impl(
             include_url_lists=include_url_lists,
             max_urls_per_pattern=max_urls_per_pattern
         )
+        # Only cache successful analyses - timeouts and errors may be transient
+        if result.get("status") == "success":
+            _store_analysis(cache_key, result)
         return result
     except Exception as e:
         # Fallback error response (should not happen, analyzer handles all errors internally)
@@ -1009,8 +1071,8 @@ def check_existing_crawl(
                     "chunk_count": row[3],
                 }
             return None
-    except Exception as e:
-        logger.error(f"check_existing_crawl failed: {e}")
+    except Exception:
+        logger.exception("check_existing_crawl failed")
         raise
 
 
@@ -1056,8 +1118,8 @@ def check_existing_file(
                     "created_at": row[2].isoformat() if row[2] else None,
                 }
             return None
-    except Exception as e:
-        logger.error(f"check_existing_file failed: {e}")
+    except Exception:
+        logger.exception("check_existing_file failed")
         raise
 
 
@@ -1104,8 +1166,8 @@ def check_existing_files_batch(
                 }
                 for row in cur.fetchall()
             ]
-    except Exception as e:
-        logger.error(f"check_existing_files_batch failed: {e}")
+    except Exception:
+        logger.exception("check_existing_files_batch failed")
         raise
 
 
@@ -1151,8 +1213,8 @@ def check_existing_title(
                     "created_at": row[2].isoformat() if row[2] else None,
                 }
             return None
-    except Exception as e:
-        logger.error(f"check_existing_title failed: {e}")
+    except Exception:
+        logger.exception("check_existing_title failed")
         raise
 
 
@@ -1360,6 +1422,10 @@ async def ingest_url_impl(
         if progress_callback:
             await progress_callback(20, 100, f"Web crawl complete ({len(results)} pages), starting ingestion...")
 
+        # Capture crawl session info up front so page content can be released as we go
+        pages_crawled = len(results)
+        crawl_session_id = results[0].metadata.get("crawl_session_id") if results else None
+
         # Ingest each page (route through unified mediator if available)
         document_ids = []
         total_chunks = 0
@@ -1370,23 +1436,29 @@ async def ingest_url_impl(
             if not result.success:
                 continue
 
+            # Nothing survived content filtering - skip before paying for chunking,
+            # embeddings and LLM entity extraction on an empty document
+            if not result.content or result.content.isspace():
+                logger.warning("Skipping page with no extractable content: %s", result.url)
+                continue
+
+            page_title = result.metadata.get("title", result.url)
+
             # Progress: Per-page ingestion (20% to 90%)
             if progress_callback:
-                page_progress = 20 + int((idx / len(results)) * 70)
+                page_progress = 20 + int((idx / pages_crawled) * 70)
                 await progress_callback(
                     page_progress,
                     100,
-                    f"Ingesting page {idx + 1}/{len(results)}: {result.metadata.get('title', result.url)[:50]}..."
+                    f"Ingesting page {idx + 1}/{pages_crawled}: {page_title[:50]}..."
                 )
 
             try:
-                page_title = result.metadata.get("title", result.url)
-
                 # Merge user metadata with page metadata
                 page_metadata = metadata.copy() if metadata else {}
                 page_metadata.update(result.metadata)
 
-                logger.info(f"Ingesting page through unified mediator: {page_title}")
+                logger.info("Ingesting page through unified mediator: %s", page_title)
                 # Note: Don't pass progress_callback here - would conflict with parent progress
                 ingest_result = await unified_mediator.ingest_text(
                     content=result.content,
@@ -1401,20 +1473,22 @@ async def ingest_url_impl(
                 successful_ingests += 1
 
             except Exception as e:
-                logger.warning(f"Failed to ingest page {result.url}: {e}")
+                logger.warning("Failed to ingest page %s: %s", result.url, e)
+            finally:
+                # Page is persisted (or skipped) - drop its markdown so a multi-page
+                # crawl doesn't hold every page body in memory until the response is built
+                result.content = ""
 
         response = {
             "mode": mode,
-            "pages_crawled": len(results),
+            "pages_crawled": pages_crawled,
             "pages_ingested": successful_ingests,
             "total_chunks": total_chunks,
             "collection_name": collection_name,
             "entities_extracted": total_entities,
             "crawl_metadata": {
                 "crawl_root_url": url,
-                "crawl_session_id": (
-                    results[0].metadata.get("crawl_session_id") if results else None
-                ),
+                "crawl_session_id": crawl_session_id,
                 "crawl_timestamp": datetime.now().isoformat(),
             },
         }
@@ -1426,8 +1500,8 @@ async def ingest_url_impl(
             response["document_ids"] = document_ids
 
         return response
-    except Exception as e:
-        logger.error(f"ingest_url failed: {e}")
+    except Exception:
+        logger.exception("ingest_url failed")
         raise
 
 
@@ -1464,7 +1538,6 @@ async def ingest_file_impl(
             return health_error
 
         # Validate path is within configured mounts
-        from src.core.config_loader import is_path_in_mounts
         is_valid, mount_msg = is_path_in_mounts(file_path)
         if not is_valid:
             raise PermissionError(mount_msg)
@@ -1542,8 +1615,8 @@ async def ingest_file_impl(
             result["chunk_ids"] = ingest_result.get("chunk_ids", [])
 
         return result
-    except Exception as e:
-        logger.error(f"ingest_file failed: {e}")
+    except Exception:
+        logger.exception("ingest_file failed")
         raise
 
 
@@ -1582,7 +1655,6 @@ async def ingest_directory_impl(
             return health_error
 
         # Validate path is within configured mounts
-        from src.core.config_loader import is_path_in_mounts
         is_valid, mount_msg = is_path_in_mounts(directory_path)
         if not is_valid:
             raise PermissionError(mount_msg)
@@ -1606,15 +1678,10 @@ async def ingest_directory_impl(
         if progress_callback:
             await progress_callback(5, 100, f"Scanning directory for {', '.join(file_extensions)} files...")
 
-        # Find files
-        files = []
-        for ext in file_extensions:
-            if recursive:
-                files.extend(path.rglob(f"*{ext}"))
-            else:
-                files.extend(path.glob(f"*{ext}"))
-
-        files = sorted(set(files))
+        # Find files - walk the directory once and match every extension in the same pass
+        suffixes = tuple(file_extensions)
+        candidates = path.rglob("*") if recursive else path.iterdir()
+        files = sorted(f for f in candidates if f.name.endswith(suffixes))
 
         # Progress: Found files
         if progress_callback:
@@ -1710,8 +1777,8 @@ async def ingest_directory_impl(
             result["failed_files"] = failed_files
 
         return result
-    except Exception as e:
-        logger.error(f"ingest_directory failed: {e}")
+    except Exception:
+        logger.exception("ingest_directory failed")
         raise
 
 
@@ -1761,21 +1828,8 @@ async def update_document_impl(
                 raise ValueError(f"Document {document_id} not found after update")
 
             # Get collection name from chunks (since doc might be in multiple collections)
-            conn = db.connect()
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    SELECT DISTINCT c.name
-                    FROM collections c
-                    JOIN chunk_collections cc ON cc.collection_id = c.id
-                    JOIN document_chunks dc ON dc.id = cc.chunk_id
-                    WHERE dc.source_document_id = %s
-                    LIMIT 1
-                    """,
-                    (document_id,)
-                )
-                row = cur.fetchone()
-                collection_name = row[0] if row else "unknown"
+            collections = doc_store.get_document_collections(document_id)
+            collection_name = collections[0][1] if collections else "unknown"
 
             # Build graph metadata
             graph_metadata = updated_doc["metadata"].copy() if updated_doc["metadata"] else {}
@@ -1802,8 +1856,8 @@ async def update_document_impl(
                 )
 
         return result
-    except Exception as e:
-        logger.error(f"update_document failed: {e}")
+    except Exception:
+        logger.exception("update_document failed")
         raise
 
 
@@ -1829,8 +1883,8 @@ async def delete_document_impl(
 
         result = await doc_store.delete_document(document_id, graph_store=graph_store)
         return result
-    except Exception as e:
-        logger.error(f"delete_document failed: {e}")
+    except Exception:
+        logger.exception("delete_document failed")
         raise
 
 
@@ -1867,8 +1921,8 @@ def list_documents_impl(
                 doc["updated_at"] = doc["updated_at"].isoformat()
 
         return result
-    except Exception as e:
-        logger.error(f"list_documents failed: {e}")
+    except Exception:
+        logger.exception("list_documents failed")
         raise
 
 
@@ -1938,14 +1992,18 @@ async def query_relationships_impl(
                 }
 
                 # Add source and target entity info if available
-                if hasattr(edge, 'source_node_uuid'):
-                    rel["source_node_id"] = str(edge.source_node_uuid)
-                if hasattr(edge, 'target_node_uuid'):
-                    rel["target_node_id"] = str(edge.target_node_uuid)
+                # (single getattr per field instead of hasattr + attribute access)
+                source_node_uuid = getattr(edge, 'source_node_uuid', _MISSING)
+                if source_node_uuid is not _MISSING:
+                    rel["source_node_id"] = str(source_node_uuid)
+                target_node_uuid = getattr(edge, 'target_node_uuid', _MISSING)
+                if target_node_uuid is not _MISSING:
+                    rel["target_node_id"] = str(target_node_uuid)
 
                 # Add when relationship was established (temporal info is for query_temporal only)
-                if hasattr(edge, 'valid_at') and edge.valid_at:
-                    rel["valid_from"] = edge.valid_at.isoformat()
+                valid_at = getattr(edge, 'valid_at', None)
+                if valid_at:
+                    rel["valid_from"] = valid_at.isoformat()
 
                 relationships.append(rel)
             except Exception as e:
@@ -1960,7 +2018,7 @@ async def query_relationships_impl(
         }
 
     except Exception as e:
-        logger.error(f"query_relationships failed: {e}")
+        logger.exception("query_relationships failed")
         return {
             "status": "error",
             "message": str(e),
@@ -2021,24 +2079,25 @@ async def query_temporal_impl(
                     "relationship_type": getattr(edge, 'name', 'RELATED_TO'),
                 }
 
-                # Add temporal validity
-                if hasattr(edge, 'valid_at') and edge.valid_at:
-                    item["valid_from"] = edge.valid_at.isoformat()
-                else:
-                    item["valid_from"] = None
+                # Add temporal validity (single getattr per field instead of hasattr + access)
+                valid_at = getattr(edge, 'valid_at', None)
+                item["valid_from"] = valid_at.isoformat() if valid_at else None
 
-                if hasattr(edge, 'invalid_at') and edge.invalid_at:
-                    item["valid_until"] = edge.invalid_at.isoformat()
+                invalid_at = getattr(edge, 'invalid_at', None)
+                if invalid_at:
+                    item["valid_until"] = invalid_at.isoformat()
                     item["status"] = "superseded"
                 else:
                     item["valid_until"] = None
                     item["status"] = "current"
 
                 # Add creation/expiration timestamps
-                if hasattr(edge, 'created_at') and edge.created_at:
-                    item["created_at"] = edge.created_at.isoformat()
-                if hasattr(edge, 'expired_at') and edge.expired_at:
-                    item["expired_at"] = edge.expired_at.isoformat()
+                created_at = getattr(edge, 'created_at', None)
+                if created_at:
+                    item["created_at"] = created_at.isoformat()
+                expired_at = getattr(edge, 'expired_at', None)
+                if expired_at:
+                    item["expired_at"] = expired_at.isoformat()
 
                 timeline_items.append(item)
             except Exception as e:
@@ -2059,7 +2118,7 @@ async def query_temporal_impl(
         }
 
     except Exception as e:
-        logger.error(f"query_temporal failed: {e}")
+        logger.exception("query_temporal failed")
         return {
             "status": "error",
             "message": str(e),
@@ -1,7 +1,8 @@
 """Similarity search with pgvector and proper distance-to-similarity conversion."""
 
 import logging
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 from pgvector.psycopg import register_vector
@@ -13,10 +14,27 @@ from src.core.embeddings import EmbeddingGenerator
 
 logger = logging.getLogger(__name__)
 
+# Number of recent query embeddings each SimilaritySearch keeps
+QUERY_EMBEDDING_CACHE_SIZE = 256
+
 
 class ChunkSearchResult:
     """Represents a search result for a document chunk."""
 
+    __slots__ = (
+        "char_end",
+        "char_start",
+        "chunk_id",
+        "chunk_index",
+        "content",
+        "distance",
+        "metadata",
+        "similarity",
+        "source_content",
+        "source_document_id",
+        "source_filename",
+    )
+
     def __init__(
         self,
         chunk_id: int,
@@ -106,11 +124,43 @@ class SimilaritySearch:
         self.embedder = embedding_generator
         self.collection_mgr = collection_manager
 
+        # Repeated queries reuse their embedding instead of another API round trip.
+        # Stored as immutable tuples in least-recently-used order.
+        self._query_embedding_cache: OrderedDict[str, Tuple[float, ...]] = OrderedDict()
+
         # Register pgvector type with psycopg
         conn = self.db.connect()
         register_vector(conn)
         logger.info("SimilaritySearch initialized")
 
+    def _embed_query(self, query: str) -> np.ndarray:
+        """
+        Get the normalized embedding for a search query, reusing recent ones.
+
+        Args:
+            query: Query text
+
+        Returns:
+            Normalized query embedding as a new numpy array (for pgvector)
+        """
+        cached = self._query_embedding_cache.get(query)
+        if cached is not None:
+            self._query_embedding_cache.move_to_end(query)
+            return np.array(cached)
+
+        logger.debug(f"Generating embedding for chunk query: {query[:100]}...")
+        query_embedding = self.embedder.generate_embedding(query, normalize=True)
+
+        # Verify normalization
+        if not self.embedder.verify_normalization(query_embedding):
+            logger.warning("Query embedding normalization verification failed!")
+
+        self._query_embedding_cache[query] = tuple(query_embedding)
+        if len(self._query_embedding_cache) > QUERY_EMBEDDING_CACHE_SIZE:
+            self._query_embedding_cache.popitem(last=False)
+
+        return np.array(query_embedding)
+
     def search_chunks(
         self,
         query: str,
@@ -137,16 +187,7 @@ class SimilaritySearch:
         if not query or not query.strip():
             raise ValueError("Query cannot be empty")
 
-        # Generate normalized query embedding
-        logger.debug(f"Generating embedding for chunk query: {query[:100]}...")
-        query_embedding = self.embedder.generate_embedding(query, normalize=True)
-
-        # Verify normalization
-        if not self.embedder.verify_normalization(query_embedding):
-            logger.warning("Query embedding normalization verification failed!")
-
-        # Convert to numpy array for pgvector
-        query_embedding = np.array(query_embedding)
+        query_embedding = self._embed_query(query)
 
         conn = self.db.connect()
 
@@ -8,15 +8,36 @@ This module abstracts Graphiti complexity, providing a simple interface for:
 """
 
 import logging
+import os
 import time
 from datetime import datetime
 from typing import Optional, Any
 from graphiti_core import Graphiti
 from graphiti_core.nodes import EpisodeType
+from graphiti_core.search.search_config_recipes import (
+    COMBINED_HYBRID_SEARCH_MMR,
+    COMBINED_HYBRID_SEARCH_RRF,
+    COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
+)
+from graphiti_core.search.search_filters import SearchFilters, DateFilter
 from neo4j import exceptions
 
 logger = logging.getLogger(__name__)
 
+# Map search strategy name (SEARCH_STRATEGY in config.yaml) to Graphiti recipe
+SEARCH_STRATEGY_RECIPES = {
+    'mmr': COMBINED_HYBRID_SEARCH_MMR,
+    'rrf': COMBINED_HYBRID_SEARCH_RRF,
+    'cross_encoder': COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
+}
+
+# Strategy-specific default reranker threshold
+DEFAULT_RERANKER_MIN_SCORES = {
+    'mmr': 0.2,            # MMR with balanced filtering
+    'rrf': 0.2,            # RRF with balanced filtering
+    'cross_encoder': 0.35  # Cross-encoder needs stricter filtering
+}
+
 
 class GraphStore:
     """Wrapper for Graphiti operations, abstracts Neo4j complexity."""
@@ -343,6 +364,84 @@ class GraphStore:
             logger.error(f"❌ Error looking up episode UUID: {e}")
             return None
 
+    async def get_episode_uuids_by_names(self, episode_names: list[str]) -> dict[str, Optional[str]]:
+        """
+        Look up UUIDs for several episodes in a single Neo4j query.
+
+        Args:
+            episode_names: Names of the episodes (e.g., ["doc_42", "doc_43"])
+
+        Returns:
+            Dictionary mapping every requested name to its UUID, or None if not found
+        """
+        uuids: dict[str, Optional[str]] = dict.fromkeys(episode_names)
+        if not uuids:
+            return uuids
+
+        logger.info(f"🔍 Looking up episode UUIDs for {len(uuids)} names")
+
+        try:
+            query = """
+            UNWIND $names AS name
+            MATCH (e:Episodic {name: name})
+            RETURN name, e.uuid as uuid
+            """
+
+            result = await self.graphiti.driver.execute_query(
+                query,
+                names=list(uuids)
+            )
+
+            for record in result.records:
+                # Keep the first match per name, like get_episode_uuid_by_name's LIMIT 1
+                if uuids[record['name']] is None:
+                    uuids[record['name']] = record['uuid']
+
+            found = sum(1 for uuid in uuids.values() if uuid)
+            logger.info(f"✅ Found {found}/{len(uuids)} episode UUIDs")
+
+        except Exception as e:
+            logger.error(f"❌ Error looking up episode UUIDs: {e}")
+
+        return uuids
+
+    async def delete_episodes_by_names(self, episode_names: list[str]) -> dict[str, int]:
+        """
+        Delete several episodes by name, resolving all UUIDs in one lookup.
+
+        Each found episode is removed with Graphiti's remove_episode, so orphaned
+        entity and edge cleanup matches delete_episode_by_name.
+
+        Args:
+            episode_names: Names of the episodes (e.g., ["doc_42", "doc_43"])
+
+        Returns:
+            Dictionary with "deleted", "not_found" and "failed" counts
+        """
+        logger.info(f"🗑️  GraphStore.delete_episodes_by_names() - Deleting {len(episode_names)} episodes")
+
+        counts = {"deleted": 0, "not_found": 0, "failed": 0}
+        uuids = await self.get_episode_uuids_by_names(episode_names)
+
+        for episode_name, episode_uuid in uuids.items():
+            if not episode_uuid:
+                logger.debug(f"Episode '{episode_name}' not found in graph (skipped)")
+                counts["not_found"] += 1
+                continue
+
+            try:
+                await self.graphiti.remove_episode(episode_uuid)
+                counts["deleted"] += 1
+            except Exception as e:
+                logger.warning(f"Failed to delete episode '{episode_name}': {e}")
+                counts["failed"] += 1
+
+        logger.info(
+            f"✅ Episode deletion complete: {counts['deleted']} deleted, "
+            f"{counts['failed']} failures, {counts['not_found']} not found"
+        )
+        return counts
+
     async def delete_episode_by_name(self, episode_name: str) -> bool:
         """
         Delete episode by name (looks up UUID first, then deletes).
@@ -407,34 +506,15 @@ class GraphStore:
             List of search results (edges) from the knowledge graph.
             Uses both nodes and edges for comprehensive context.
         """
-        import os
-        from graphiti_core.search.search_config_recipes import (
-            COMBINED_HYBRID_SEARCH_MMR,
-            COMBINED_HYBRID_SEARCH_RRF,
-            COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
-        )
-
         # Get strategy from environment (set from config.yaml)
         strategy = os.getenv('SEARCH_STRATEGY', 'mmr').lower()
 
-        # Map strategy name to recipe
-        strategy_map = {
-            'mmr': COMBINED_HYBRID_SEARCH_MMR,
-            'rrf': COMBINED_HYBRID_SEARCH_RRF,
-            'cross_encoder': COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
-        }
-
         # Get the recipe (default to MMR if invalid strategy)
-        recipe = strategy_map.get(strategy, COMBINED_HYBRID_SEARCH_MMR)
+        recipe = SEARCH_STRATEGY_RECIPES.get(strategy, COMBINED_HYBRID_SEARCH_MMR)
 
         # Use strategy-specific default threshold if not provided
         if reranker_min_score is None:
-            default_thresholds = {
-                'mmr': 0.2,            # MMR with balanced filtering
-                'rrf': 0.2,            # RRF with balanced filtering
-                'cross_encoder': 0.35  # Cross-encoder needs stricter filtering
-            }
-            reranker_min_score = default_thresholds.get(strategy, 0.2)
+            reranker_min_score = DEFAULT_RERANKER_MIN_SCORES.get(strategy, 0.2)
 
         # Create config from recipe
         config = recipe.model_copy(deep=True)
@@ -481,37 +561,16 @@ class GraphStore:
         Returns:
             List of search results (edges) with temporal validity information.
         """
-        import os
-        from graphiti_core.search.search_config_recipes import (
-            COMBINED_HYBRID_SEARCH_MMR,
-            COMBINED_HYBRID_SEARCH_RRF,
-            COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
-        )
-        from graphiti_core.search.search_filters import SearchFilters, DateFilter
-        from datetime import datetime
-
         # Get strategy from environment (can be overridden with TEMPORAL_SEARCH_STRATEGY in future)
         strategy = os.getenv('TEMPORAL_SEARCH_STRATEGY') or os.getenv('SEARCH_STRATEGY', 'mmr')
         strategy = strategy.lower()
 
-        # Map strategy name to recipe
-        strategy_map = {
-            'mmr': COMBINED_HYBRID_SEARCH_MMR,
-            'rrf': COMBINED_HYBRID_SEARCH_RRF,
-            'cross_encoder': COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
-        }
-
         # Get the recipe (default to MMR if invalid strategy)
-        recipe = strategy_map.get(strategy, COMBINED_HYBRID_SEARCH_MMR)
+        recipe = SEARCH_STRATEGY_RECIPES.get(strategy, COMBINED_HYBRID_SEARCH_MMR)
 
         # Use strategy-specific default threshold if not provided
         if reranker_min_score is None:
-            default_thresholds = {
-                'mmr': 0.2,            # MMR with balanced filtering
-                'rrf': 0.2,            # RRF with balanced filtering
-                'cross_encoder': 0.35  # Cross-encoder needs stricter filtering
-            }
-            reranker_min_score = default_thresholds.get(strategy, 0.2)
+            reranker_min_score = DEFAULT_RERANKER_MIN_SCORES.get(strategy, 0.2)
 
         # Build temporal filters if date parameters provided
         search_filter = None
@@ -265,6 +265,86 @@ def initialize_test_postgres():
 # INTEGRATION TEST ISOLATION: Complete database cleanup after every test
 # ============================================================================
 
+# One Neo4j driver (and its connection pool) shared by every per-test cleanup.
+# Opening a driver - or a full Graphiti instance - per test paid connection setup
+# on every test and leaked the un-closed async drivers. The sync driver is not bound
+# to an event loop, so it is safe to share across pytest-asyncio's per-test loops.
+_neo4j_cleanup_driver = None
+
+
+def _get_neo4j_cleanup_driver():
+    """Return the session-wide Neo4j driver used for test cleanup (created on first use)."""
+    global _neo4j_cleanup_driver
+    if _neo4j_cleanup_driver is None:
+        from neo4j import GraphDatabase
+
+        neo4j_uri = os.getenv("NEO4J_URI", "bolt://localhost:7689")
+        neo4j_user = os.getenv("NEO4J_USER", "neo4j")
+        neo4j_password = os.getenv("NEO4J_PASSWORD", "test-password")
+
+        # Cleanup queries run one at a time, so a tiny pool is enough. A short acquisition
+        # timeout makes an unreachable Neo4j fail the cleanup fast instead of after the
+        # driver's 60s default.
+        _neo4j_cleanup_driver = GraphDatabase.driver(
+            neo4j_uri,
+            auth=(neo4j_user, neo4j_password),
+            max_connection_pool_size=2,
+            connection_acquisition_timeout=10.0,
+            connection_timeout=5.0,
+        )
+    return _neo4j_cleanup_driver
+
+
+def _clear_neo4j():
+    """Delete all nodes and relationships from the test Neo4j database.
+
+    Deletes in batches of 10,000 nodes per inner transaction so a graph left over
+    from a failed run is cleared in one statement without building a single huge
+    transaction. CALL ... IN TRANSACTIONS needs an auto-commit transaction, so this
+    goes through session.run() rather than execute_query().
+    """
+    with _get_neo4j_cleanup_driver().session() as session:
+        session.run(
+            "MATCH (n) CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF 10000 ROWS"
+        ).consume()
+
+
+# Likewise one PostgreSQL connection for cleanup instead of a new Database() per test.
+# Database.connect() transparently reconnects if the connection was closed.
+_cleanup_db = None
+
+
+def _clear_postgres():
+    """Delete all rows from the RAG tables (in foreign-key order) in a single round trip."""
+    global _cleanup_db
+    if _cleanup_db is None:
+        _cleanup_db = Database()
+    conn = _cleanup_db.connect()
+    with conn.cursor() as cur:
+        cur.execute(
+            # chunk_collections references both chunks and collections,
+            # document_chunks references source_documents
+            "DELETE FROM chunk_collections; "
+            "DELETE FROM document_chunks; "
+            "DELETE FROM collections; "
+            "DELETE FROM source_documents;"
+        )
+    conn.commit()  # No-op under autocommit, kept in case the connection mode changes
+
+
+@pytest.fixture(scope="session", autouse=True)
+def close_cleanup_connections():
+    """Close the shared cleanup connections once the test session ends."""
+    global _neo4j_cleanup_driver, _cleanup_db
+    yield
+    if _neo4j_cleanup_driver is not None:
+        _neo4j_cleanup_driver.close()
+        _neo4j_cleanup_driver = None
+    if _cleanup_db is not None:
+        _cleanup_db.close()
+        _cleanup_db = None
+
+
 @pytest_asyncio.fixture(autouse=True, scope="function")
 async def cleanup_after_each_test():
     """
@@ -288,38 +368,15 @@ async def cleanup_after_each_test():
 
     # CLEANUP PHASE: Delete everything from both databases after test completes
 
-    # PostgreSQL cleanup - delete in order respecting foreign keys
+    # PostgreSQL cleanup - delete in order respecting foreign keys (shared connection)
     try:
-        db = Database()
-        conn = db.connect()
-        with conn.cursor() as cur:
-            # chunk_collections references both chunks and collections
-            cur.execute("DELETE FROM chunk_collections;")
-            # document_chunks references source_documents
-            cur.execute("DELETE FROM document_chunks;")
-            # collections table
-            cur.execute("DELETE FROM collections;")
-            # source_documents table
-            cur.execute("DELETE FROM source_documents;")
-        conn.commit()  # CRITICAL: Commit the deletions!
-        db.close()
+        _clear_postgres()
     except Exception as e:
         raise RuntimeError(f"PostgreSQL cleanup failed: {e}")
 
-    # Neo4j cleanup - delete all nodes and relationships (ASYNC)
+    # Neo4j cleanup - delete all nodes and relationships (shared driver, off the event loop)
     try:
-        neo4j_uri = os.getenv("NEO4J_URI", "bolt://localhost:7689")
-        neo4j_user = os.getenv("NEO4J_USER", "neo4j")
-        neo4j_password = os.getenv("NEO4J_PASSWORD", "test-password")
-
-        from graphiti_core import Graphiti
-
-        graphiti = Graphiti(
-            uri=neo4j_uri,
-            user=neo4j_user,
-            password=neo4j_password
-        )
-        await graphiti.driver.execute_query("MATCH (n) DETACH DELETE n")
+        await asyncio.to_thread(_clear_neo4j)
     except Exception as e:
         raise RuntimeError(f"Neo4j cleanup failed: {e}")
 
@@ -356,36 +413,15 @@ def cleanup_after_each_test_sync(request):
 
     # CLEANUP PHASE: Delete everything from both databases after test completes
 
-    # PostgreSQL cleanup - delete in order respecting foreign keys
+    # PostgreSQL cleanup - delete in order respecting foreign keys (shared connection)
     try:
-        db = Database()
-        conn = db.connect()
-        with conn.cursor() as cur:
-            # chunk_collections references both chunks and collections
-            cur.execute("DELETE FROM chunk_collections;")
-            # document_chunks references source_documents
-            cur.execute("DELETE FROM document_chunks;")
-            # collections table
-            cur.execute("DELETE FROM collections;")
-            # source_documents table
-            cur.execute("DELETE FROM source_documents;")
-        conn.commit()  # CRITICAL: Commit the deletions!
-        db.close()
+        _clear_postgres()
     except Exception as e:
         raise RuntimeError(f"PostgreSQL cleanup failed: {e}")
 
-    # Neo4j cleanup - delete all nodes and relationships (SYNC)
+    # Neo4j cleanup - delete all nodes and relationships (shared driver)
     try:
-        from neo4j import GraphDatabase
-
-        neo4j_uri = os.getenv("NEO4J_URI", "bolt://localhost:7689")
-        neo4j_user = os.getenv("NEO4J_USER", "neo4j")
-        neo4j_password = os.getenv("NEO4J_PASSWORD", "test-password")
-
-        driver = GraphDatabase.driver(neo4j_uri, auth=(neo4j_user, neo4j_password))
-        with driver.session() as session:
-            session.run("MATCH (n) DETACH DELETE n")
-        driver.close()
+        _clear_neo4j()
     except Exception as e:
         raise RuntimeError(f"Neo4j cleanup failed: {e}")
 
@@ -415,11 +451,11 @@ async def test_db():
         pass
 
 
-@pytest_asyncio.fixture
-async def embedder():
+@pytest.fixture(scope="session")
+def embedder():
     """Create embedding generator for tests.
 
-    Scope: function
+    Scope: session (stateless, so one instance is shared by every test)
     Available to: all test suites
     """
     return EmbeddingGenerator()
@@ -476,23 +512,10 @@ async def setup_test_collection(collection_mgr, test_collection_name):
 
     yield test_collection_name
 
-    # Cleanup: Must delete from BOTH PostgreSQL AND Neo4j to prevent state pollution
+    # Cleanup: Neo4j is wiped by the autouse cleanup fixtures through their shared
+    # driver, so there is no need to open a fresh Graphiti connection per test just
+    # to delete this collection's episodes.
     try:
-        # Initialize graph_store for cleanup (required to delete Neo4j episodes)
-        from graphiti_core import Graphiti
-        from src.unified import GraphStore
-        import os
-
-        neo4j_uri = os.getenv("NEO4J_URI", "bolt://localhost:7689")
-        neo4j_user = os.getenv("NEO4J_USER", "neo4j")
-        neo4j_password = os.getenv("NEO4J_PASSWORD", "test-password")
-
-        graphiti = Graphiti(neo4j_uri, neo4j_user, neo4j_password)
-        graph_store = GraphStore(graphiti)
-
-        # Delete collection with graph cleanup
-        await collection_mgr.delete_collection(test_collection_name, graph_store=graph_store)
-
-        await graphiti.close()
+        await collection_mgr.delete_collection(test_collection_name)
     except Exception:
         pass
@@ -12,6 +12,8 @@ Key design:
 """
 
 import asyncio
+import importlib.util
+import json
 import os
 import sys
 import subprocess
@@ -24,6 +26,16 @@ import pytest
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client, get_default_environment
 
+# orjson parses tool responses faster; it comes with the optional "performance"
+# extra (and usually via langsmith), so fall back to the standard library.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Only needed as a flag: anyio imports uvloop itself when asked to use it
+UVLOOP_AVAILABLE = importlib.util.find_spec("uvloop") is not None
+
 
 # Mark all tests in this module as async
 pytestmark = pytest.mark.anyio
@@ -35,7 +47,12 @@ def anyio_backend():
 
     Without this, pytest-anyio tries to run tests with both asyncio and trio,
     but trio is not installed, causing test failures.
+
+    Uses uvloop when the optional "performance" extra is installed, matching
+    the event loop the MCP server itself runs on.
     """
+    if UVLOOP_AVAILABLE:
+        return "asyncio", {"use_uvloop": True}
     return "asyncio"
 
 
@@ -206,10 +223,10 @@ def extract_text_content(result) -> Optional[str]:
     """
     from mcp import types
 
-    for content in result.content:
-        if isinstance(content, types.TextContent):
-            return content.text
-    return None
+    return next(
+        (content.text for content in result.content if isinstance(content, types.TextContent)),
+        None,
+    )
 
 
 def extract_result_data(result):
@@ -224,8 +241,6 @@ def extract_result_data(result):
     Returns:
         Python object (list, dict, etc.) extracted from structuredContent or parsed JSON
     """
-    import json
-
     # Use structuredContent if available (MCP protocol optimization for lists)
     if hasattr(result, 'structuredContent') and result.structuredContent:
         return result.structuredContent.get('result')
@@ -233,7 +248,7 @@ def extract_result_data(result):
     # Fallback to text parsing
     text = extract_text_content(result)
     if text:
-        return json.loads(text)
+        return json_loads(text)
 
     return None
 
@@ -247,6 +262,4 @@ def extract_error_text(result) -> Optional[str]:
     Returns:
         Error text if result is an error, None otherwise
     """
-    if result.isError and result.content:
-        return extract_text_content(result)
-    return None
+    return extract_text_content(result) if result.isError and result.content else None
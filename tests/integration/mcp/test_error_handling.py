@@ -3,6 +3,7 @@
 Tests that tools properly handle errors and edge cases.
 """
 
+import asyncio
 import json
 import pytest
 from .conftest import extract_text_content, extract_error_text
@@ -77,23 +78,24 @@ class TestErrorHandling:
             "document_title": "Test"
         })
 
-        # Search with extreme threshold (should handle gracefully)
-        result = await session.call_tool("search_documents", {
-            "query": "test",
-            "collection_name": collection,
-            "threshold": 0.0,  # Minimum
-            "limit": 5
-        })
+        # Search with extreme thresholds (should handle gracefully).
+        # The two searches are independent, so issue them concurrently.
+        result, result2 = await asyncio.gather(
+            session.call_tool("search_documents", {
+                "query": "test",
+                "collection_name": collection,
+                "threshold": 0.0,  # Minimum
+                "limit": 5
+            }),
+            session.call_tool("search_documents", {
+                "query": "test",
+                "collection_name": collection,
+                "threshold": 1.0,  # Maximum
+                "limit": 5
+            }),
+        )
 
         assert not result.isError, "Should handle minimum threshold"
-
-        result2 = await session.call_tool("search_documents", {
-            "query": "test",
-            "collection_name": collection,
-            "threshold": 1.0,  # Maximum
-            "limit": 5
-        })
-
         assert not result2.isError, "Should handle maximum threshold"
 
     async def test_create_duplicate_collection(self, mcp_session):
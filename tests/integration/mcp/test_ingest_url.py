@@ -3,6 +3,7 @@
 Tests that ingest_url() correctly crawls web pages and stores them in databases.
 """
 
+import asyncio
 import json
 import pytest
 from .conftest import extract_text_content, extract_result_data
@@ -199,20 +200,21 @@ class TestIngestUrl:
         assert "pages_crawled" in response2, "Reingest response should include pages_crawled"
         assert response2["pages_crawled"] >= 1, "Reingest should indicate pages were processed"
 
-        # NEW: Verify old documents are completely deleted
-        for old_doc_id in first_doc_ids:
-            verify_result = await session.call_tool("get_document_by_id", {
-                "document_id": old_doc_id
-            })
+        # NEW: Verify old documents are deleted and new documents exist
+        # (lookups are independent reads, so they are issued concurrently)
+        assert len(second_doc_ids) >= 1, "Reingest should return new document IDs"
+        verify_results = await asyncio.gather(*(
+            session.call_tool("get_document_by_id", {"document_id": doc_id})
+            for doc_id in first_doc_ids + second_doc_ids
+        ))
+        old_results = verify_results[:len(first_doc_ids)]
+        new_results = verify_results[len(first_doc_ids):]
+
+        for old_doc_id, verify_result in zip(first_doc_ids, old_results):
             assert verify_result.isError, \
                 f"Old document {old_doc_id} should be deleted after reingest"
 
-        # NEW: Verify new documents exist
-        assert len(second_doc_ids) >= 1, "Reingest should return new document IDs"
-        for new_doc_id in second_doc_ids:
-            verify_result = await session.call_tool("get_document_by_id", {
-                "document_id": new_doc_id
-            })
+        for new_doc_id, verify_result in zip(second_doc_ids, new_results):
             assert not verify_result.isError, \
                 f"New document {new_doc_id} should exist after reingest"
 
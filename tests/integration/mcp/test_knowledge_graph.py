@@ -3,6 +3,7 @@
 Tests query_relationships and query_temporal tools.
 """
 
+import asyncio
 import json
 import pytest
 from .conftest import extract_text_content, extract_error_text
@@ -155,19 +156,20 @@ class TestQueryTemporal:
             "document_title": "Releases"
         })
 
-        # Query with high threshold (more restrictive, fewer results)
-        result_high = await session.call_tool("query_temporal", {
-            "query": "What versions were released?",
-            "collection_name": collection,
-            "threshold": 0.7  # High threshold
-        })
-
-        # Query with low threshold (less restrictive, more results)
-        result_low = await session.call_tool("query_temporal", {
-            "query": "What versions were released?",
-            "collection_name": collection,
-            "threshold": 0.1  # Low threshold
-        })
+        # Query with high threshold (more restrictive, fewer results) and low threshold
+        # (less restrictive, more results). The queries are independent, so issue both at once.
+        result_high, result_low = await asyncio.gather(
+            session.call_tool("query_temporal", {
+                "query": "What versions were released?",
+                "collection_name": collection,
+                "threshold": 0.7  # High threshold
+            }),
+            session.call_tool("query_temporal", {
+                "query": "What versions were released?",
+                "collection_name": collection,
+                "threshold": 0.1  # Low threshold
+            }),
+        )
 
         # Both queries should complete without error
         assert result_high is not None
@@ -111,10 +111,10 @@ class TestDeleteCollectionGraphCleanup:
         print(f"✅ Created {len(doc_ids)} documents: {doc_ids}")
 
         # Verify episodes exist in Neo4j
+        episode_names = [f"doc_{doc_id}" for doc_id in doc_ids]
         episodes_before = []
-        for doc_id in doc_ids:
-            episode_name = f"doc_{doc_id}"
-            episode_uuid = await graph_store.get_episode_uuid_by_name(episode_name)
+        uuids_before = await graph_store.get_episode_uuids_by_names(episode_names)
+        for episode_name, episode_uuid in uuids_before.items():
             if episode_uuid:
                 episodes_before.append(episode_name)
                 print(f"✅ Found episode: {episode_name} (UUID: {episode_uuid})")
@@ -137,9 +137,8 @@ class TestDeleteCollectionGraphCleanup:
 
         # Verify episodes are gone from Neo4j
         episodes_after = []
-        for doc_id in doc_ids:
-            episode_name = f"doc_{doc_id}"
-            episode_uuid = await graph_store.get_episode_uuid_by_name(episode_name)
+        uuids_after = await graph_store.get_episode_uuids_by_names(episode_names)
+        for episode_name, episode_uuid in uuids_after.items():
             if episode_uuid:
                 episodes_after.append(episode_name)
                 print(f"❌ FOUND ORPHANED EPISODE: {episode_name} (should be deleted!)")
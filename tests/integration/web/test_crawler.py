@@ -4,6 +4,18 @@ import pytest
 
 from src.ingestion.web_crawler import crawl_single_page
 
+# Several read-only tests inspect the same example.com crawl. Crawl it once per module
+# (each crawl launches a browser) and share the resulting CrawlResult between them.
+_example_page = None
+
+
+async def crawl_example_page():
+    """Return the shared https://example.com crawl result, crawling on first use."""
+    global _example_page
+    if _example_page is None:
+        _example_page = await crawl_single_page("https://example.com", headless=True)
+    return _example_page
+
 
 @pytest.mark.asyncio
 class TestWebCrawler:
@@ -11,7 +23,7 @@ class TestWebCrawler:
 
     async def test_crawl_single_page_success(self):
         """Test successful single-page crawl."""
-        result = await crawl_single_page("https://example.com", headless=True)
+        result = await crawl_example_page()
 
         assert result.success is True
         assert result.error is None
@@ -56,7 +68,7 @@ class TestWebCrawler:
 
     async def test_metadata_structure(self):
         """Test that metadata contains all required fields."""
-        result = await crawl_single_page("https://example.com")
+        result = await crawl_example_page()
 
         required_fields = [
             "source",
@@ -69,6 +81,7 @@ class TestWebCrawler:
             "domain",
             "status_code",
             "content_length",
+            "filtered_content_length",
             "crawler_version",
         ]
 
@@ -77,7 +90,7 @@ class TestWebCrawler:
 
     async def test_crawl_result_to_dict(self):
         """Test CrawlResult serialization."""
-        result = await crawl_single_page("https://example.com")
+        result = await crawl_example_page()
 
         result_dict = result.to_dict()
 
@@ -133,6 +133,7 @@ class TestWebCrawlerLinkFollowing:
             "domain",
             "status_code",
             "content_length",
+            "filtered_content_length",
             "crawler_version",
         ]
 
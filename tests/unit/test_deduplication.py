@@ -0,0 +1,152 @@
+"""Unit tests for MCP request deduplication."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.mcp import deduplication
+from src.mcp.deduplication import RequestDeduplicator, deduplicate_request
+
+
+async def _ingest_tool(content, collection_name, metadata=None, include_chunk_ids=False):
+    """Stand-in tool signature for hashing tests."""
+
+
+def _hash(deduplicator, *args, **kwargs):
+    """Hash a call to _ingest_tool the same way the decorator does."""
+    bound_args = deduplicator._get_signature(_ingest_tool).bind(*args, **kwargs)
+    bound_args.apply_defaults()
+    hashed_params = deduplicator._get_hashed_params(_ingest_tool)
+    return deduplicator._hash_request("ingest", hashed_params, bound_args)
+
+
+class TestRequestHashing:
+    """Tests for RequestDeduplicator._hash_request."""
+
+    def test_equivalent_requests_hash_equal(self):
+        """Positional vs keyword args, dict key order and list vs tuple don't matter."""
+        deduplicator = RequestDeduplicator()
+
+        first = _hash(deduplicator, "text", "docs", {"a": 1, "b": [1, 2]})
+        second = _hash(
+            deduplicator,
+            content="text",
+            collection_name="docs",
+            metadata={"b": (1, 2), "a": 1},
+        )
+
+        assert first == second
+        assert len(first) == 16
+
+    def test_different_requests_hash_differently(self):
+        """Changing a parameter that affects the request changes the hash."""
+        deduplicator = RequestDeduplicator()
+
+        assert _hash(deduplicator, "text", "docs") != _hash(deduplicator, "text", "other")
+
+    def test_ignored_parameters_excluded(self):
+        """Client-preference fields are not hashed."""
+        deduplicator = RequestDeduplicator()
+
+        assert "include_chunk_ids" not in deduplicator._get_hashed_params(_ingest_tool)
+        assert _hash(deduplicator, "text", "docs", include_chunk_ids=True) == _hash(
+            deduplicator, "text", "docs", include_chunk_ids=False
+        )
+
+    @pytest.mark.skipif(not deduplication.ORJSON_AVAILABLE, reason="orjson not installed")
+    @pytest.mark.parametrize(
+        "metadata",
+        [
+            {"title": "Café ✓", "tags": ["a", "b"], "score": 0.7, "draft": False, "n": None},
+            {2: "two", 10: "ten"},
+            {"crawled_at": datetime(2024, 1, 2, 3, 4, 5)},
+            {"big": 2**70},
+        ],
+        ids=["json-values", "non-str-keys", "datetime", "big-int"],
+    )
+    def test_orjson_and_stdlib_hashes_match(self, metadata):
+        """The orjson fast path and the stdlib fallback produce the same hash."""
+        deduplicator = RequestDeduplicator()
+
+        orjson_hash = _hash(deduplicator, "text", "docs", metadata)
+        with patch.object(deduplication, "ORJSON_AVAILABLE", False):
+            stdlib_hash = _hash(deduplicator, "text", "docs", metadata)
+
+        assert orjson_hash == stdlib_hash
+
+
+class TestRequestRegistration:
+    """Tests for check_and_register / unregister."""
+
+    @pytest.mark.asyncio
+    async def test_register_unregister_round_trip(self):
+        """A registered hash is rejected until it is unregistered."""
+        deduplicator = RequestDeduplicator()
+
+        assert await deduplicator.check_and_register("ingest", "abc123") is None
+        error = await deduplicator.check_and_register("ingest", "abc123")
+        assert "already processing" in error
+
+        await deduplicator.unregister("ingest", "abc123")
+
+        assert await deduplicator.check_and_register("ingest", "abc123") is None
+
+    @pytest.mark.asyncio
+    async def test_distinct_hashes_tracked_independently(self):
+        """Unregistering one request leaves others active."""
+        deduplicator = RequestDeduplicator()
+
+        await deduplicator.check_and_register("ingest", "first")
+        await deduplicator.check_and_register("ingest", "second")
+        await deduplicator.unregister("ingest", "first")
+
+        assert await deduplicator.check_and_register("ingest", "first") is None
+        assert await deduplicator.check_and_register("ingest", "second") is not None
+
+    @pytest.mark.asyncio
+    async def test_unregister_unknown_hash_is_noop(self):
+        """Unregistering a hash that was never registered does not raise."""
+        deduplicator = RequestDeduplicator()
+
+        await deduplicator.unregister("ingest", "missing")
+
+
+class TestDeduplicateDecorator:
+    """Tests for the deduplicate_request decorator."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicate_rejected_then_released(self):
+        """A duplicate concurrent call is rejected; the hash is released afterwards."""
+        release = asyncio.Event()
+
+        @deduplicate_request("test_dedup_tool")
+        async def tool(content, include_chunk_ids=False):
+            await release.wait()
+            return {"content": content}
+
+        first = asyncio.create_task(tool("text"))
+        await asyncio.sleep(0)
+
+        duplicate = await tool("text", include_chunk_ids=True)
+        assert duplicate["status"] == "duplicate_request"
+
+        release.set()
+        assert await first == {"content": "text"}
+
+        # Released after completion, so the same request can run again
+        assert await tool("text") == {"content": "text"}
+
+    @pytest.mark.asyncio
+    async def test_hash_released_when_tool_raises(self):
+        """The request is unregistered even if the tool raises."""
+
+        @deduplicate_request("test_dedup_failing_tool")
+        async def tool(content):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await tool("text")
+        with pytest.raises(RuntimeError):
+            await tool("text")
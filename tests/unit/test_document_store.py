@@ -0,0 +1,117 @@
+"""Unit tests for DocumentStore chunk embedding and storage."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.documents import Document
+
+from src.ingestion.document_store import DocumentStore
+
+
+def _make_store():
+    """Build a DocumentStore with mocked database and embedder."""
+    embedder = MagicMock()
+    embedder.generate_embeddings.side_effect = lambda texts, normalize=True: [
+        [float(len(text))] for text in texts
+    ]
+
+    with patch("src.ingestion.document_store.register_vector"):
+        store = DocumentStore(MagicMock(), embedder, MagicMock(), chunker=MagicMock())
+    return store, embedder
+
+
+def _make_chunks(count):
+    """Chunks with distinct content lengths so embeddings identify their chunk."""
+    return [
+        Document(page_content="x" * (i + 1), metadata={"chunk_index": i})
+        for i in range(count)
+    ]
+
+
+def _make_conn(chunk_ids):
+    """Connection whose cursor returns one RETURNING result set per inserted chunk."""
+    conn = MagicMock()
+    cur = conn.cursor.return_value.__enter__.return_value
+    cur.fetchone.side_effect = [(chunk_id,) for chunk_id in chunk_ids]
+    cur.nextset.side_effect = [True] * (len(chunk_ids) - 1) + [None]
+    return conn, cur
+
+
+class TestEmbedChunks:
+    """Tests for DocumentStore._embed_chunks."""
+
+    def test_embeddings_batched_in_chunk_order(self):
+        """Chunks are embedded in batches and stay aligned with their chunks."""
+        store, embedder = _make_store()
+
+        with patch("src.ingestion.document_store.EMBEDDING_BATCH_SIZE", 2):
+            embeddings = store._embed_chunks(_make_chunks(5))
+
+        assert embedder.generate_embeddings.call_count == 3
+        assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+
+    def test_short_batch_raises(self):
+        """A batch that comes back short would misalign chunks and must raise."""
+        store, embedder = _make_store()
+        embedder.generate_embeddings.side_effect = lambda texts, normalize=True: [
+            [1.0] for text in texts if text.strip()
+        ]
+        chunks = _make_chunks(2) + [Document(page_content="   ", metadata={})]
+
+        with pytest.raises(ValueError, match="empty text"):
+            store._embed_chunks(chunks)
+
+
+class TestStoreChunks:
+    """Tests for DocumentStore._store_chunks."""
+
+    def test_chunk_ids_follow_input_order(self):
+        """IDs are read from each RETURNING result set in insertion order."""
+        store, _ = _make_store()
+        conn, cur = _make_conn([101, 102, 103])
+
+        chunk_ids = store._store_chunks(conn, 7, _make_chunks(3), [1, 2])
+
+        assert chunk_ids == [101, 102, 103]
+
+        insert_sql, insert_rows = cur.executemany.call_args_list[0].args
+        assert "INSERT INTO document_chunks" in insert_sql
+        assert cur.executemany.call_args_list[0].kwargs == {"returning": True}
+        assert [(row[0], row[1], row[2], row[6]) for row in insert_rows] == [
+            (7, 0, "x", [1.0]),
+            (7, 1, "xx", [2.0]),
+            (7, 2, "xxx", [3.0]),
+        ]
+
+        link_sql, link_rows = cur.executemany.call_args_list[1].args
+        assert "INSERT INTO chunk_collections" in link_sql
+        assert link_rows == [(101, 1), (101, 2), (102, 1), (102, 2), (103, 1), (103, 2)]
+
+    def test_no_collections_skips_linking(self):
+        """Without collection IDs only the chunk insert runs."""
+        store, _ = _make_store()
+        conn, cur = _make_conn([101])
+
+        assert store._store_chunks(conn, 7, _make_chunks(1), []) == [101]
+        assert cur.executemany.call_count == 1
+
+    def test_no_chunks_skips_embedding_and_inserts(self):
+        """An empty chunk list touches neither the embedder nor the database."""
+        store, embedder = _make_store()
+        conn = MagicMock()
+
+        assert store._store_chunks(conn, 7, [], [1]) == []
+        embedder.generate_embeddings.assert_not_called()
+        conn.cursor.assert_not_called()
+
+    def test_embedding_failure_inserts_nothing(self):
+        """Embeddings are generated before any insert, so a failure writes no rows."""
+        store, embedder = _make_store()
+        embedder.generate_embeddings.side_effect = ValueError(
+            "Cannot generate embedding for empty text"
+        )
+        conn = MagicMock()
+
+        with pytest.raises(ValueError):
+            store._store_chunks(conn, 7, _make_chunks(2), [1])
+        conn.cursor.assert_not_called()
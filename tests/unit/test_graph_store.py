@@ -279,6 +279,43 @@ class TestGraphStore:
 
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_get_episode_uuids_by_names(self, graph_store, mock_graphiti):
+        """Test batched UUID lookup maps every requested name in one query."""
+        mock_result = MagicMock()
+        mock_result.records = [{"name": "doc_1", "uuid": "uuid-1"}]
+        mock_graphiti.driver.execute_query.return_value = mock_result
+
+        result = await graph_store.get_episode_uuids_by_names(["doc_1", "doc_2"])
+
+        assert result == {"doc_1": "uuid-1", "doc_2": None}
+        mock_graphiti.driver.execute_query.assert_awaited_once()
+        assert mock_graphiti.driver.execute_query.call_args.kwargs["names"] == ["doc_1", "doc_2"]
+
+    @pytest.mark.asyncio
+    async def test_get_episode_uuids_by_names_empty(self, graph_store, mock_graphiti):
+        """Test batched UUID lookup skips the query for an empty name list."""
+        result = await graph_store.get_episode_uuids_by_names([])
+
+        assert result == {}
+        mock_graphiti.driver.execute_query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_episodes_by_names(self, graph_store, mock_graphiti):
+        """Test bulk deletion removes found episodes and counts the rest."""
+        mock_result = MagicMock()
+        mock_result.records = [
+            {"name": "doc_1", "uuid": "uuid-1"},
+            {"name": "doc_2", "uuid": "uuid-2"},
+        ]
+        mock_graphiti.driver.execute_query.return_value = mock_result
+        mock_graphiti.remove_episode = AsyncMock(side_effect=[None, Exception("boom")])
+
+        result = await graph_store.delete_episodes_by_names(["doc_1", "doc_2", "doc_3"])
+
+        assert result == {"deleted": 1, "not_found": 1, "failed": 1}
+        assert mock_graphiti.remove_episode.await_count == 2
+
     @pytest.mark.asyncio
     async def test_search_relationships_success(self, graph_store, mock_graphiti):
         """Test successful relationship search."""
@@ -0,0 +1,55 @@
+"""Unit tests for MCP delete_collection tool graph cleanup reporting."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.mcp.tools import delete_collection_impl
+
+
+def _make_coll_mgr():
+    """Collection manager mock for a collection with two documents."""
+    coll_mgr = MagicMock()
+    coll_mgr.get_collection.return_value = {"name": "test-collection", "document_count": 2}
+    coll_mgr.delete_collection = AsyncMock(return_value=True)
+    return coll_mgr
+
+
+class TestMCPDeleteCollectionGraphCleanup:
+    """Tests for how delete_collection reports knowledge graph cleanup."""
+
+    @pytest.mark.asyncio
+    async def test_graph_episodes_cleaned(self):
+        """Source documents found -> their episodes are deleted and reported."""
+        coll_mgr = _make_coll_mgr()
+        db = MagicMock()
+        cur = db.connect.return_value.cursor.return_value.__enter__.return_value
+        cur.fetchall.return_value = [(1,), (2,)]
+        graph_store = MagicMock()
+        graph_store.delete_episodes_by_names = AsyncMock(
+            return_value={"deleted": 2, "not_found": 0, "failed": 0}
+        )
+
+        result = await delete_collection_impl(
+            coll_mgr, "test-collection", confirm=True, graph_store=graph_store, db=db
+        )
+
+        graph_store.delete_episodes_by_names.assert_awaited_once_with(["doc_1", "doc_2"])
+        assert "(2 graph episodes cleaned)" in result["message"]
+
+    @pytest.mark.asyncio
+    async def test_source_doc_lookup_failure_is_reported(self):
+        """A failed document lookup must not look like a collection with no documents."""
+        coll_mgr = _make_coll_mgr()
+        db = MagicMock()
+        db.connect.return_value.cursor.side_effect = RuntimeError("connection lost")
+        graph_store = MagicMock()
+        graph_store.delete_episodes_by_names = AsyncMock()
+
+        result = await delete_collection_impl(
+            coll_mgr, "test-collection", confirm=True, graph_store=graph_store, db=db
+        )
+
+        assert result["deleted"] is True
+        graph_store.delete_episodes_by_names.assert_not_awaited()
+        assert "graph cleanup was skipped" in result["message"]
@@ -0,0 +1,94 @@
+"""Tests for SimilaritySearch query embedding reuse."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from src.retrieval.search import SimilaritySearch
+
+
+def _make_search():
+    """Build a SimilaritySearch with mocked database and embedder."""
+    embedder = MagicMock()
+    embedder.generate_embedding.side_effect = lambda text, normalize=True: [0.6, 0.8]
+    embedder.verify_normalization.return_value = True
+
+    db = MagicMock()
+    cur = db.connect.return_value.cursor.return_value.__enter__.return_value
+    cur.fetchall.return_value = []
+
+    with patch("src.retrieval.search.register_vector"):
+        search = SimilaritySearch(db, embedder, MagicMock())
+    return search, embedder, cur
+
+
+def _searched_embedding(cur):
+    """Query embedding passed to the most recent search query."""
+    _, params = cur.execute.call_args.args
+    return params[0]
+
+
+class TestQueryEmbeddingCache:
+    """Test that repeated queries reuse their embedding."""
+
+    def test_repeated_query_embeds_once(self):
+        """Same query text should only call the embedding API once."""
+        search, embedder, cur = _make_search()
+
+        search.search_chunks("what is rag memory?")
+        first = _searched_embedding(cur)
+        search.search_chunks("what is rag memory?")
+        second = _searched_embedding(cur)
+
+        assert embedder.generate_embedding.call_count == 1
+        assert isinstance(first, np.ndarray)
+        np.testing.assert_array_equal(first, second)
+
+    def test_cached_embedding_not_shared_between_searches(self):
+        """Modifying one search's embedding must not corrupt the cached value."""
+        search, _, cur = _make_search()
+
+        search.search_chunks("what is rag memory?")
+        first = _searched_embedding(cur)
+        first[0] = 99.0
+        search.search_chunks("what is rag memory?")
+        second = _searched_embedding(cur)
+
+        assert second is not first
+        np.testing.assert_array_equal(second, [0.6, 0.8])
+
+    def test_distinct_queries_embed_separately(self):
+        """Different query text should each be embedded."""
+        search, embedder, _ = _make_search()
+
+        search.search_chunks("first query")
+        search.search_chunks("second query")
+
+        assert embedder.generate_embedding.call_count == 2
+
+    def test_least_recently_used_query_evicted(self):
+        """Only the most recently used queries are kept."""
+        search, embedder, _ = _make_search()
+
+        with patch("src.retrieval.search.QUERY_EMBEDDING_CACHE_SIZE", 2):
+            search.search_chunks("first query")
+            search.search_chunks("second query")
+            search.search_chunks("first query")
+            search.search_chunks("third query")
+            assert embedder.generate_embedding.call_count == 3
+
+            search.search_chunks("first query")
+            assert embedder.generate_embedding.call_count == 3
+            search.search_chunks("second query")
+            assert embedder.generate_embedding.call_count == 4
+
+    def test_cache_is_per_instance(self):
+        """Each SimilaritySearch keeps its own cache (embedders may differ)."""
+        search_a, embedder_a, _ = _make_search()
+        search_b, embedder_b, _ = _make_search()
+
+        search_a.search_chunks("shared query")
+        search_b.search_chunks("shared query")
+
+        assert embedder_a.generate_embedding.call_count == 1
+        assert embedder_b.generate_embedding.call_count == 1
@@ -104,6 +104,22 @@ class TestWebsiteAnalyzer:
         assert stats["/empty"]["count"] == 0
         assert stats["/empty"]["avg_depth"] == 0
 
+    def test_get_pattern_stats_duplicate_urls(self):
+        """Test that duplicate URLs count toward avg_depth once per occurrence."""
+        analyzer = WebsiteAnalyzer("https://example.com")
+
+        # Depths: 2, 2, 4 -> avg 2.7 (2.0 if duplicates were collapsed)
+        stats = analyzer._get_pattern_stats({
+            "/docs": [
+                "https://example.com/docs/intro",
+                "https://example.com/docs/intro",
+                "https://example.com/docs/guides/advanced/setup"
+            ]
+        })
+
+        assert stats["/docs"]["count"] == 3
+        assert stats["/docs"]["avg_depth"] == 2.7
+
     @pytest.mark.asyncio
     @patch('src.ingestion.website_analyzer.ASYNCURLSEEDER_AVAILABLE', False)
     async def test_analyze_async_tool_not_available(self):
@@ -416,3 +432,88 @@ class TestEdgeCases:
         assert "2.50s" in notes
         assert "5 patterns" in notes
         assert "example.com" in notes
+
+
+class TestAnalyzeWebsiteImplCache:
+    """Tests for the analyze_website_impl result cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        from src.mcp import tools
+        tools._analysis_cache.clear()
+        yield
+        tools._analysis_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_successful_analysis_is_cached(self):
+        """Repeat calls with the same arguments reuse a successful analysis."""
+        from src.mcp.tools import analyze_website_impl
+
+        success = {"base_url": "https://example.com", "status": "success", "total_urls": 3}
+        with patch('src.mcp.tools.analyze_website_async', AsyncMock(return_value=success)) as mock_analyze:
+            first = await analyze_website_impl("https://example.com")
+            second = await analyze_website_impl("https://example.com")
+            # Different arguments are a different cache entry
+            await analyze_website_impl("https://example.com", include_url_lists=True)
+
+        assert first == second == success
+        assert mock_analyze.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_analysis_is_not_cached(self):
+        """Timeouts and errors are retried on the next call."""
+        from src.mcp.tools import analyze_website_impl
+
+        timeout = {"base_url": "https://example.com", "status": "timeout", "total_urls": 0}
+        with patch('src.mcp.tools.analyze_website_async', AsyncMock(return_value=timeout)) as mock_analyze:
+            await analyze_website_impl("https://example.com")
+            await analyze_website_impl("https://example.com")
+
+        assert mock_analyze.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_analysis_expires(self):
+        """Entries older than the TTL are refreshed."""
+        from src.mcp import tools
+
+        success = {"base_url": "https://example.com", "status": "success", "total_urls": 3}
+        with patch('src.mcp.tools.analyze_website_async', AsyncMock(return_value=success)) as mock_analyze:
+            await tools.analyze_website_impl("https://example.com")
+            key = next(iter(tools._analysis_cache))
+            cached_at, result = tools._analysis_cache[key]
+            tools._analysis_cache[key] = (cached_at - tools.ANALYSIS_CACHE_TTL_SECONDS - 1, result)
+            await tools.analyze_website_impl("https://example.com")
+
+        assert mock_analyze.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self):
+        """The cache never grows past ANALYSIS_CACHE_MAX_ENTRIES."""
+        from src.mcp import tools
+
+        success = {"base_url": "https://example.com", "status": "success", "total_urls": 3}
+        with patch('src.mcp.tools.analyze_website_async', AsyncMock(return_value=success)), \
+             patch.object(tools, 'ANALYSIS_CACHE_MAX_ENTRIES', 2):
+            await tools.analyze_website_impl("https://a.example.com")
+            await tools.analyze_website_impl("https://b.example.com")
+            # Touch a so b becomes least recently used
+            await tools.analyze_website_impl("https://a.example.com")
+            await tools.analyze_website_impl("https://c.example.com")
+
+        cached_urls = [key[0] for key in tools._analysis_cache]
+        assert cached_urls == ["https://a.example.com", "https://c.example.com"]
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_evicted_on_insert(self):
+        """Storing a new analysis drops entries older than the TTL."""
+        from src.mcp import tools
+
+        success = {"base_url": "https://example.com", "status": "success", "total_urls": 3}
+        with patch('src.mcp.tools.analyze_website_async', AsyncMock(return_value=success)):
+            await tools.analyze_website_impl("https://old.example.com")
+            key = next(iter(tools._analysis_cache))
+            cached_at, result = tools._analysis_cache[key]
+            tools._analysis_cache[key] = (cached_at - tools.ANALYSIS_CACHE_TTL_SECONDS - 1, result)
+            await tools.analyze_website_impl("https://new.example.com")
+
+        assert [key[0] for key in tools._analysis_cache] == ["https://new.example.com"]